@@ -67,6 +67,11 @@ DEFAULT_CONFIG = {
         "upscale_resample_method": "LANCZOS",
     },
 }
+LOWERCASE_OPTIONS = (
+    ("API", "ocr_provider"),
+    ("API", "translation_provider"),
+    ("API", "fallback_ocr_provider"),
+)
 
 
 class ConfigManager:
@@ -118,6 +123,11 @@ class ConfigManager:
                     print(
                         f"配置文件缺少选项 '{option}' 在节 '[{section}]' 下, 已添加默认值 '{default_value}'。"
                     )
+        for section, option in LOWERCASE_OPTIONS:
+            value = self.config.get(section, option)
+            if value != value.lower():
+                self.config.set(section, option, value.lower())
+                needs_update = True
         if needs_update:
             self._save_config_to_file()
 
@@ -190,6 +200,47 @@ class ConfigManager:
                     return fallback
             return fallback
 
+    def get_many(self, spec):
+        values = {}
+        sections = {name: self.config[name] for name in self.config.sections()}
+        for section, option, fallback, kind in spec:
+            section_proxy = sections.get(section)
+            raw_value = section_proxy.get(option) if section_proxy is not None else None
+            if kind == "bool":
+                value = (
+                    self.config.BOOLEAN_STATES.get(raw_value.lower())
+                    if raw_value is not None
+                    else None
+                )
+                if value is None:
+                    if section in DEFAULT_CONFIG and option in DEFAULT_CONFIG[section]:
+                        val_str = str(DEFAULT_CONFIG[section][option]).lower()
+                        value = val_str in ("true", "yes", "1", "on")
+                    else:
+                        value = fallback
+            elif kind == "int":
+                try:
+                    value = int(raw_value) if raw_value is not None else None
+                except ValueError:
+                    value = None
+                if value is None:
+                    try:
+                        value = int(DEFAULT_CONFIG[section][option])
+                    except (KeyError, ValueError, TypeError):
+                        value = fallback
+            elif raw_value is not None:
+                value = raw_value
+            elif (
+                fallback is None
+                and section in DEFAULT_CONFIG
+                and option in DEFAULT_CONFIG[section]
+            ):
+                value = str(DEFAULT_CONFIG[section][option])
+            else:
+                value = fallback
+            values[(section, option)] = value
+        return values
+
     def set(self, section, option, value):
         if not self.config.has_section(section):
             self.config.add_section(section)
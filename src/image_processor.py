@@ -49,6 +49,10 @@ class ProcessedBlock:
         angle: float = 0.0,
         id: str | int | None = None,
         text_align: str | None = None,
+        main_color: tuple | None = None,
+        outline_color: tuple | None = None,
+        background_color: tuple | None = None,
+        outline_thickness: int | None = None,
     ):
         self.id = id if id is not None else str(time.time_ns())
         self.original_text = original_text
@@ -72,6 +76,10 @@ class ProcessedBlock:
                 self.text_align = "left"
         else:
             self.text_align = text_align
+        self.main_color = main_color
+        self.outline_color = outline_color
+        self.background_color = background_color
+        self.outline_thickness = outline_thickness
 
     def __repr__(self):
         return (
@@ -72,6 +72,7 @@ from utils.utils import (
     check_dependencies_availability,
     draw_processed_blocks_pil,
     _render_single_block_pil_for_preview,
+    parse_rgba,
 )
 from utils.font_utils import find_font_path
 from ui.glossary_settings_dialog import GlossarySettingsDialog
@@ -198,15 +199,7 @@ class InteractiveLabel(QWidget):
         self.update()
 
     def _parse_color_str(self, color_str: str, default_color_tuple: tuple) -> tuple:
-        try:
-            parts = list(map(int, color_str.split(",")))
-            if len(parts) == 3:
-                return (parts[0], parts[1], parts[2], 255)
-            if len(parts) == 4:
-                return (parts[0], parts[1], parts[2], parts[3])
-        except:
-            pass
-        return default_color_tuple
+        return parse_rgba(color_str, default_color_tuple)
 
     def reload_style_configs(self):
         self._font_name_config = self.config_manager.get("UI", "font_name", "msyh.ttc")
@@ -266,14 +259,6 @@ class InteractiveLabel(QWidget):
                     block_item.font_size_category,
                     self.font_size_mapping.get("medium", 22),
                 )
-            if not hasattr(block_item, "main_color"):
-                block_item.main_color = None
-            if not hasattr(block_item, "outline_color"):
-                block_item.outline_color = None
-            if not hasattr(block_item, "background_color"):
-                block_item.background_color = None
-            if not hasattr(block_item, "outline_thickness"):
-                block_item.outline_thickness = None
             self._invalidate_block_cache(block_item)
         self.update()
 
@@ -287,23 +272,22 @@ class InteractiveLabel(QWidget):
     def _get_block_visual_hash(self, block: ProcessedBlock) -> int:
         main_color_to_hash = (
             block.main_color
-            if hasattr(block, "main_color") and block.main_color is not None
+            if block.main_color is not None
             else self._text_main_color_pil
         )
         outline_color_to_hash = (
             block.outline_color
-            if hasattr(block, "outline_color") and block.outline_color is not None
+            if block.outline_color is not None
             else self._text_outline_color_pil
         )
         bg_color_to_hash = (
             block.background_color
-            if hasattr(block, "background_color") and block.background_color is not None
+            if block.background_color is not None
             else self._text_bg_color_pil
         )
         outline_thickness_to_hash = (
             block.outline_thickness
-            if hasattr(block, "outline_thickness")
-            and block.outline_thickness is not None
+            if block.outline_thickness is not None
             else self._outline_thickness
         )
         relevant_attrs = (
@@ -341,23 +325,22 @@ class InteractiveLabel(QWidget):
                 return cached_pixmap
         main_color = (
             block.main_color
-            if hasattr(block, "main_color") and block.main_color is not None
+            if block.main_color is not None
             else self._text_main_color_pil
         )
         outline_color = (
             block.outline_color
-            if hasattr(block, "outline_color") and block.outline_color is not None
+            if block.outline_color is not None
             else self._text_outline_color_pil
         )
         bg_color = (
             block.background_color
-            if hasattr(block, "background_color") and block.background_color is not None
+            if block.background_color is not None
             else self._text_bg_color_pil
         )
         thickness = (
             block.outline_thickness
-            if hasattr(block, "outline_thickness")
-            and block.outline_thickness is not None
+            if block.outline_thickness is not None
             else self._outline_thickness
         )
         pil_image = _render_single_block_pil_for_preview(
@@ -394,14 +377,6 @@ class InteractiveLabel(QWidget):
         for i, block in enumerate(self.processed_blocks):
             if not hasattr(block, "id") or block.id is None:
                 block.id = f"block_{time.time_ns()}_{i}"
-            if not hasattr(block, "main_color"):
-                block.main_color = None
-            if not hasattr(block, "outline_color"):
-                block.outline_color = None
-            if not hasattr(block, "background_color"):
-                block.background_color = None
-            if not hasattr(block, "outline_thickness"):
-                block.outline_thickness = None
             fixed_font_size_override = self.config_manager.getint(
                 "UI", "fixed_font_size", 0
             )
@@ -436,7 +411,7 @@ class InteractiveLabel(QWidget):
         if pil_bg_image.mode != "RGBA":
             pil_bg_image = pil_bg_image.convert("RGBA")
         final_pil_image = draw_processed_blocks_pil(
-            pil_bg_image, self.processed_blocks, self.config_manager
+            pil_bg_image, self.processed_blocks, self.config_manager, in_place=True
         )
         return final_pil_image
 
@@ -488,6 +463,24 @@ class InteractiveLabel(QWidget):
                 pixmap_draw_x = -block_qpixmap.width() / 2.0
                 pixmap_draw_y = -block_qpixmap.height() / 2.0
                 painter.drawPixmap(QPointF(pixmap_draw_x, pixmap_draw_y), block_qpixmap)
+            elif not block.translated_text or not block.translated_text.strip():
+                empty_block_width = int(block.bbox[2] - block.bbox[0])
+                empty_block_height = int(block.bbox[3] - block.bbox[1])
+                if empty_block_width > 0 and empty_block_height > 0:
+                    empty_block_bg = (
+                        block.background_color
+                        if block.background_color is not None
+                        else self._text_bg_color_pil
+                    )
+                    painter.fillRect(
+                        QRectF(
+                            -empty_block_width / 2.0,
+                            -empty_block_height / 2.0,
+                            empty_block_width,
+                            empty_block_height,
+                        ),
+                        QColor(*empty_block_bg),
+                    )
             painter.setWorldTransform(current_painter_transform)
             painter.restore()
             if block == self.selected_block:
@@ -1157,15 +1150,6 @@ class TranslationWorker(QThread):
                 self.finished_signal.emit(None, None, self.image_path, "处理已取消。")
             elif result_tuple:
                 original_img, blocks = result_tuple
-                for block in blocks:
-                    if not hasattr(block, "main_color"):
-                        block.main_color = None
-                    if not hasattr(block, "outline_color"):
-                        block.outline_color = None
-                    if not hasattr(block, "background_color"):
-                        block.background_color = None
-                    if not hasattr(block, "outline_thickness"):
-                        block.outline_thickness = None
                 self.finished_signal.emit(
                     original_img,
                     blocks,
@@ -1252,17 +1236,8 @@ class BatchTranslationWorker(QThread):
             if result_tuple:
                 original_pil, blocks = result_tuple
                 last_proc_error = self.image_processor.get_last_error()
-                for block in blocks:
-                    if not hasattr(block, "main_color"):
-                        block.main_color = None
-                    if not hasattr(block, "outline_color"):
-                        block.outline_color = None
-                    if not hasattr(block, "background_color"):
-                        block.background_color = None
-                    if not hasattr(block, "outline_thickness"):
-                        block.outline_thickness = None
                 final_drawn_pil_image = draw_processed_blocks_pil(
-                    original_pil, blocks, self.config_manager
+                    original_pil, blocks, self.config_manager, in_place=True
                 )
                 if final_drawn_pil_image:
                     base, ext = os.path.splitext(current_file_basename)
@@ -1575,15 +1550,7 @@ class MainWindow(QMainWindow):
         )
 
     def _parse_color_str(self, color_str: str, default_color_tuple: tuple) -> tuple:
-        try:
-            parts = list(map(int, color_str.split(",")))
-            if len(parts) == 3:
-                return (parts[0], parts[1], parts[2], 255)
-            if len(parts) == 4:
-                return (parts[0], parts[1], parts[2], parts[3])
-        except:
-            pass
-        return default_color_tuple
+        return parse_rgba(color_str, default_color_tuple)
 
     def _update_block_controls(self, block: ProcessedBlock | None):
         is_block_selected = block is not None
@@ -1623,9 +1590,7 @@ class MainWindow(QMainWindow):
         )
         self.outline_thickness_spin.setValue(
             block.outline_thickness
-            if is_block_selected
-            and hasattr(block, "outline_thickness")
-            and block.outline_thickness is not None
+            if is_block_selected and block.outline_thickness is not None
             else default_thickness
         )
         default_main_color = (
@@ -1635,9 +1600,7 @@ class MainWindow(QMainWindow):
         )
         main_color_tuple = (
             block.main_color
-            if is_block_selected
-            and hasattr(block, "main_color")
-            and block.main_color is not None
+            if is_block_selected and block.main_color is not None
             else default_main_color
         )
         self._set_button_color(self.main_color_button, QColor(*main_color_tuple))
@@ -1648,9 +1611,7 @@ class MainWindow(QMainWindow):
         )
         outline_color_tuple = (
             block.outline_color
-            if is_block_selected
-            and hasattr(block, "outline_color")
-            and block.outline_color is not None
+            if is_block_selected and block.outline_color is not None
             else default_outline_color
         )
         self._set_button_color(self.outline_color_button, QColor(*outline_color_tuple))
@@ -1661,9 +1622,7 @@ class MainWindow(QMainWindow):
         )
         bg_color_tuple = (
             block.background_color
-            if is_block_selected
-            and hasattr(block, "background_color")
-            and block.background_color is not None
+            if is_block_selected and block.background_color is not None
             else default_bg_color
         )
         self._set_button_color(self.background_color_button, QColor(*bg_color_tuple))
@@ -1703,12 +1662,7 @@ class MainWindow(QMainWindow):
                 s_block.angle = new_angle % 360.0
                 changed = True
             new_thickness = self.outline_thickness_spin.value()
-            current_thickness = (
-                s_block.outline_thickness
-                if hasattr(s_block, "outline_thickness")
-                else None
-            )
-            if current_thickness != new_thickness:
+            if s_block.outline_thickness != new_thickness:
                 s_block.outline_thickness = new_thickness
                 changed = True
             if changed:
@@ -1727,21 +1681,21 @@ class MainWindow(QMainWindow):
             attribute_name = "main_color"
             current_color_tuple = (
                 s_block.main_color
-                if hasattr(s_block, "main_color") and s_block.main_color
+                if s_block.main_color is not None
                 else self.interactive_translate_area._text_main_color_pil
             )
         elif sender_button == self.outline_color_button:
             attribute_name = "outline_color"
             current_color_tuple = (
                 s_block.outline_color
-                if hasattr(s_block, "outline_color") and s_block.outline_color
+                if s_block.outline_color is not None
                 else self.interactive_translate_area._text_outline_color_pil
             )
         elif sender_button == self.background_color_button:
             attribute_name = "background_color"
             current_color_tuple = (
                 s_block.background_color
-                if hasattr(s_block, "background_color") and s_block.background_color
+                if s_block.background_color is not None
                 else self.interactive_translate_area._text_bg_color_pil
             )
         else:
@@ -2024,7 +1978,8 @@ class MainWindow(QMainWindow):
     def _on_open_api_settings(self):
         dialog = SettingsDialog(self.config_manager, self)
         if dialog.exec():
-            self.image_processor = ImageProcessor(self.config_manager)
+            if dialog.settings_changed:
+                self.image_processor = ImageProcessor(self.config_manager)
             QMessageBox.information(self, "设置", "API设置已更新。")
 
     @pyqtSlot()
@@ -1,10 +1,12 @@
 import sys
 import os
+import re
 from PyQt6.QtWidgets import (
     QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
+    QFormLayout,
     QGroupBox,
     QRadioButton,
     QLabel,
@@ -21,73 +23,180 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
 )
-from PyQt6.QtCore import Qt, pyqtSlot
-from PIL import Image
+from PyQt6.QtCore import QTimer, pyqtSlot
+
+_URL_RE = re.compile(r"https?://")
+
+
+def _is_positive_int_or_empty(text):
+    return not text or (text.isdigit() and int(text) > 0)
+
+
+def _is_http_url_or_empty(text):
+    return not text or _URL_RE.match(text) is not None
+
+
+def _is_valid_factor(text):
+    try:
+        return not float(text) < 0.1
+    except ValueError:
+        return False
 
 
 class SettingsDialog(QDialog):
+    _RESAMPLE_INDEX = {"LANCZOS": 0, "BICUBIC": 1, "BILINEAR": 2, "NEAREST": 3}
+    _FIELD_SPECS = (
+        ("GeminiAPI", "api_key", "gemini_api_key_edit", "raw_text", ""),
+        (
+            "GeminiAPI",
+            "model_name",
+            "gemini_model_edit",
+            "text",
+            "gemini-1.5-flash-latest",
+        ),
+        ("GeminiAPI", "gemini_base_url", "gemini_base_url_edit", "text", ""),
+        ("GeminiAPI", "request_timeout", "gemini_timeout_edit", "text", "60"),
+        ("GeminiAPI", "source_language", "gemini_source_lang_edit", "text", "Japanese"),
+        ("GeminiAPI", "target_language", "gemini_target_lang_edit", "text", "Chinese"),
+        ("GoogleAPI", "service_account_json", "google_key_edit", "raw_text", ""),
+        ("Proxy", "enabled", "proxy_checkbox", "bool", False),
+        ("Proxy", "host", "proxy_host_edit", "text", "127.0.0.1"),
+        ("Proxy", "port", "proxy_port_edit", "text", "21524"),
+        (
+            "LLMImagePreprocessing",
+            "enabled",
+            "llm_preprocess_enabled_checkbox",
+            "bool",
+            False,
+        ),
+        (
+            "LLMImagePreprocessing",
+            "upscale_factor",
+            "llm_upscale_factor_edit",
+            "text",
+            "1.0",
+        ),
+        (
+            "LLMImagePreprocessing",
+            "contrast_factor",
+            "llm_contrast_factor_edit",
+            "text",
+            "1.0",
+        ),
+        (
+            "LLMImagePreprocessing",
+            "upscale_resample_method",
+            "llm_resample_method_combo",
+            "resample",
+            "LANCZOS",
+        ),
+    )
+    _SETTINGS_SPEC = (
+        ("API", "ocr_provider", "gemini", "str"),
+        ("API", "fallback_ocr_provider", "google cloud vision", "str"),
+        ("API", "translation_provider", "gemini", "str"),
+        ("Proxy", "type", "http", "str"),
+    ) + tuple(
+        (section, option, default, "bool" if kind == "bool" else "str")
+        for section, option, _attr, kind, default in _FIELD_SPECS
+    )
+    _VALIDATORS = (
+        (
+            lambda s: not s.proxy_checkbox.isChecked()
+            or bool(s.proxy_host_edit.text().strip()),
+            "proxy_host_edit",
+            "启用了代理，但代理地址为空。",
+        ),
+        (
+            lambda s: not s.proxy_checkbox.isChecked()
+            or s.proxy_port_edit.text().strip().isdigit(),
+            "proxy_port_edit",
+            "代理端口必须是一个有效的数字。",
+        ),
+        (
+            lambda s: bool(s.gemini_api_key_edit.text().strip()),
+            "gemini_api_key_edit",
+            "Gemini API Key 未填写。",
+        ),
+        (
+            lambda s: bool(s.gemini_source_lang_edit.text().strip()),
+            "gemini_source_lang_edit",
+            "Gemini 源语言未填写。",
+        ),
+        (
+            lambda s: bool(s.gemini_target_lang_edit.text().strip()),
+            "gemini_target_lang_edit",
+            "Gemini 目标翻译语言未填写。",
+        ),
+        (
+            lambda s: _is_positive_int_or_empty(s.gemini_timeout_edit.text().strip()),
+            "gemini_timeout_edit",
+            "Gemini 请求超时必须是一个正整数。",
+        ),
+        (
+            lambda s: _is_http_url_or_empty(s.gemini_base_url_edit.text().strip()),
+            "gemini_base_url_edit",
+            "Gemini Base URL 如果填写，必须以 http:// 或 https:// 开头。",
+        ),
+        (
+            lambda s: not s.llm_preprocess_enabled_checkbox.isChecked()
+            or _is_valid_factor(s.llm_upscale_factor_edit.text().strip()),
+            "llm_upscale_factor_edit",
+            "LLM 图像放大倍数必须是一个有效的正数 (例如 1.0, 1.5)。",
+        ),
+        (
+            lambda s: not s.llm_preprocess_enabled_checkbox.isChecked()
+            or _is_valid_factor(s.llm_contrast_factor_edit.text().strip()),
+            "llm_contrast_factor_edit",
+            "LLM 图像对比度系数必须是一个有效的正数 (例如 1.0, 1.2)。",
+        ),
+    )
+
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
         self.setWindowTitle("API及代理设置")
         self.config_manager = config_manager
         self.config = self.config_manager.get_raw_config_parser()
         self.setMinimumWidth(600)
-        self._init_ui()
-        self._load_settings()
-        self._connect_signals()
+        self._pending_placeholders = []
+        self._google_file_dialog = None
+        self._resize_pending = False
+        self._loaded_values = {}
+        self.settings_changed = False
+        self.fallback_ocr_group = None
+        self.google_ocr_widget = None
+        self.llm_preprocess_details_widget = None
+        self.proxy_details_widget = None
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self._init_ui()
+            self._load_settings()
+            self._connect_signals()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
         self.ocr_group = QGroupBox("OCR 设置")
-        ocr_layout = QVBoxLayout(self.ocr_group)
+        self._ocr_layout = QVBoxLayout(self.ocr_group)
         self.ocr_group.setSizePolicy(
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
         )
-        primary_ocr_layout = QHBoxLayout()
-        primary_ocr_label = QLabel("OCR:")
+        primary_ocr_layout = QFormLayout()
         self.primary_ocr_combo = QComboBox()
         self.primary_ocr_combo.addItems(["Gemini (推荐)", "默认gemini别动，剩下的没做"])
-        primary_ocr_layout.addWidget(primary_ocr_label)
-        primary_ocr_layout.addWidget(self.primary_ocr_combo, 1)
-        ocr_layout.addLayout(primary_ocr_layout)
-        self.fallback_ocr_group = QGroupBox(
-            "回退 OCR 设置 (仅当主要 OCR 非 Gemini 时生效)"
-        )
-        self.fallback_ocr_group.setSizePolicy(
-            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
-        )
-        self.fallback_ocr_group.setVisible(False)
-        fallback_ocr_group_layout = QVBoxLayout(self.fallback_ocr_group)
-        fallback_ocr_provider_layout = QHBoxLayout()
-        fallback_ocr_provider_label = QLabel("回退 OCR Provider:")
-        self.fallback_ocr_provider_combo = QComboBox()
-        self.fallback_ocr_provider_combo.addItems(["Google Cloud Vision"])
-        fallback_ocr_provider_layout.addWidget(fallback_ocr_provider_label)
-        fallback_ocr_provider_layout.addWidget(self.fallback_ocr_provider_combo, 1)
-        fallback_ocr_group_layout.addLayout(fallback_ocr_provider_layout)
-        self.google_ocr_widget = QWidget()
-        self.google_ocr_widget.setVisible(False)
-        google_ocr_layout = QHBoxLayout(self.google_ocr_widget)
-        google_key_label = QLabel("Google 服务账号 JSON:")
-        self.google_key_edit = QLineEdit()
-        self.google_key_button = QPushButton("浏览...")
-        google_ocr_layout.addWidget(google_key_label)
-        google_ocr_layout.addWidget(self.google_key_edit, 1)
-        google_ocr_layout.addWidget(self.google_key_button)
-        fallback_ocr_group_layout.addWidget(self.google_ocr_widget)
-        ocr_layout.addWidget(self.fallback_ocr_group)
+        primary_ocr_layout.addRow("OCR:", self.primary_ocr_combo)
+        self._ocr_layout.addLayout(primary_ocr_layout)
         main_layout.addWidget(self.ocr_group)
         self.trans_group = QGroupBox("翻译设置")
-        trans_layout = QVBoxLayout(self.trans_group)
+        trans_layout = QFormLayout(self.trans_group)
         self.trans_group.setSizePolicy(
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed
         )
-        primary_trans_layout = QHBoxLayout()
-        primary_trans_label = QLabel("翻译:")
         self.primary_trans_fixed_label = QLabel("Gemini")
-        primary_trans_layout.addWidget(primary_trans_label)
-        primary_trans_layout.addWidget(self.primary_trans_fixed_label, 1)
-        trans_layout.addLayout(primary_trans_layout)
+        trans_layout.addRow("翻译:", self.primary_trans_fixed_label)
         main_layout.addWidget(self.trans_group)
         self.gemini_group = QGroupBox("Gemini API 设置")
         self.gemini_group.setVisible(False)
@@ -95,130 +204,60 @@ class SettingsDialog(QDialog):
         self.gemini_group.setSizePolicy(
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
         )
-        gemini_key_layout = QHBoxLayout()
-        gemini_key_label = QLabel("Gemini API Key:")
+        gemini_form_layout = QFormLayout()
         self.gemini_api_key_edit = QLineEdit()
-        self.gemini_api_key_edit.setPlaceholderText("粘贴你的 Gemini API Key，必填")
+        self._defer_placeholder(
+            self.gemini_api_key_edit, "粘贴你的 Gemini API Key，必填"
+        )
         self.gemini_api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        gemini_key_layout.addWidget(gemini_key_label)
-        gemini_key_layout.addWidget(self.gemini_api_key_edit, 1)
-        gemini_main_layout.addLayout(gemini_key_layout)
-        gemini_model_layout = QHBoxLayout()
-        gemini_model_label = QLabel("Gemini 模型名称:")
+        gemini_form_layout.addRow("Gemini API Key:", self.gemini_api_key_edit)
         self.gemini_model_edit = QLineEdit()
-        self.gemini_model_edit.setPlaceholderText("例如: gemini-1.5-flash-latest")
-        gemini_model_layout.addWidget(gemini_model_label)
-        gemini_model_layout.addWidget(self.gemini_model_edit, 1)
-        gemini_main_layout.addLayout(gemini_model_layout)
-        gemini_base_url_layout = QHBoxLayout()
-        gemini_base_url_label = QLabel("Gemini Base URL:")
+        self._defer_placeholder(self.gemini_model_edit, "例如: gemini-1.5-flash-latest")
+        gemini_form_layout.addRow("Gemini 模型名称:", self.gemini_model_edit)
         self.gemini_base_url_edit = QLineEdit()
-        self.gemini_base_url_edit.setPlaceholderText(
-            "例如: https://generativelanguage.googleapis.com/v1beta/openai/"
+        self._defer_placeholder(
+            self.gemini_base_url_edit,
+            "例如: https://generativelanguage.googleapis.com/v1beta/openai/",
         )
         self.gemini_base_url_edit.setToolTip(
             "如果留空，将使用官方默认的 Gemini API 地址"
         )
-        gemini_base_url_layout.addWidget(gemini_base_url_label)
-        gemini_base_url_layout.addWidget(self.gemini_base_url_edit, 1)
-        gemini_main_layout.addLayout(gemini_base_url_layout)
-        gemini_source_lang_layout = QHBoxLayout()
-        gemini_source_lang_label = QLabel("Gemini 源语言:")
+        gemini_form_layout.addRow("Gemini Base URL:", self.gemini_base_url_edit)
         self.gemini_source_lang_edit = QLineEdit()
-        self.gemini_source_lang_edit.setPlaceholderText(
-            "例如: Japanese, English, Korean，直接填中文（如：粤语）也行"
+        self._defer_placeholder(
+            self.gemini_source_lang_edit,
+            "例如: Japanese, English, Korean，直接填中文（如：粤语）也行",
         )
-        gemini_source_lang_layout.addWidget(gemini_source_lang_label)
-        gemini_source_lang_layout.addWidget(self.gemini_source_lang_edit, 1)
-        gemini_main_layout.addLayout(gemini_source_lang_layout)
-        gemini_target_lang_layout = QHBoxLayout()
-        gemini_target_lang_label = QLabel("Gemini 目标翻译语言:")
+        gemini_form_layout.addRow("Gemini 源语言:", self.gemini_source_lang_edit)
         self.gemini_target_lang_edit = QLineEdit()
-        self.gemini_target_lang_edit.setPlaceholderText(
-            "例如: Chinese, English，直接填中文（如：粤语）也行"
+        self._defer_placeholder(
+            self.gemini_target_lang_edit,
+            "例如: Chinese, English，直接填中文（如：粤语）也行",
         )
-        gemini_target_lang_layout.addWidget(gemini_target_lang_label)
-        gemini_target_lang_layout.addWidget(self.gemini_target_lang_edit, 1)
-        gemini_main_layout.addLayout(gemini_target_lang_layout)
-        gemini_timeout_layout = QHBoxLayout()
-        gemini_timeout_label = QLabel("Gemini 请求超时 (秒):")
+        gemini_form_layout.addRow("Gemini 目标翻译语言:", self.gemini_target_lang_edit)
         self.gemini_timeout_edit = QLineEdit()
-        self.gemini_timeout_edit.setPlaceholderText("例如: 60")
-        gemini_timeout_layout.addWidget(gemini_timeout_label)
-        gemini_timeout_layout.addWidget(self.gemini_timeout_edit, 0)
-        gemini_main_layout.addLayout(gemini_timeout_layout)
+        self._defer_placeholder(self.gemini_timeout_edit, "例如: 60")
+        gemini_form_layout.addRow("Gemini 请求超时 (秒):", self.gemini_timeout_edit)
+        gemini_main_layout.addLayout(gemini_form_layout)
         self.llm_preprocess_group = QGroupBox("LLM 图像预处理 (不影响翻译后的图)")
-        llm_preprocess_layout = QVBoxLayout(self.llm_preprocess_group)
+        self._llm_preprocess_layout = QVBoxLayout(self.llm_preprocess_group)
         self.llm_preprocess_group.setSizePolicy(
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed
         )
         self.llm_preprocess_enabled_checkbox = QCheckBox(
             "启用图像预处理（或许可以小幅增加定位和翻译质量）"
         )
-        llm_preprocess_layout.addWidget(self.llm_preprocess_enabled_checkbox)
-        self.llm_preprocess_details_widget = QWidget()
-        self.llm_preprocess_details_widget.setVisible(False)
-        llm_preprocess_details_form_layout = QVBoxLayout(
-            self.llm_preprocess_details_widget
-        )
-        llm_preprocess_details_form_layout.setContentsMargins(20, 0, 0, 0)
-        upscale_layout = QHBoxLayout()
-        upscale_label = QLabel("放大倍数:")
-        self.llm_upscale_factor_edit = QLineEdit()
-        self.llm_upscale_factor_edit.setPlaceholderText(
-            "太大会把文本拆分得很碎，推荐不超过1.5，推荐LANCZOS算法"
-        )
-        upscale_layout.addWidget(upscale_label)
-        upscale_layout.addWidget(self.llm_upscale_factor_edit, 1)
-        llm_preprocess_details_form_layout.addLayout(upscale_layout)
-        resample_layout = QHBoxLayout()
-        resample_label = QLabel("放大采样方法:")
-        self.llm_resample_method_combo = QComboBox()
-        self.llm_resample_method_combo.addItems(
-            ["LANCZOS", "BICUBIC", "BILINEAR", "NEAREST"]
-        )
-        resample_layout.addWidget(resample_label)
-        resample_layout.addWidget(self.llm_resample_method_combo, 1)
-        llm_preprocess_details_form_layout.addLayout(resample_layout)
-        contrast_layout = QHBoxLayout()
-        contrast_label = QLabel("对比度系数:")
-        self.llm_contrast_factor_edit = QLineEdit()
-        self.llm_contrast_factor_edit.setPlaceholderText(
-            "太大会让识别变得很困难，推荐不超过1.3"
-        )
-        contrast_layout.addWidget(contrast_label)
-        contrast_layout.addWidget(self.llm_contrast_factor_edit, 1)
-        llm_preprocess_details_form_layout.addLayout(contrast_layout)
-        llm_preprocess_layout.addWidget(self.llm_preprocess_details_widget)
+        self._llm_preprocess_layout.addWidget(self.llm_preprocess_enabled_checkbox)
         gemini_main_layout.addWidget(self.llm_preprocess_group)
         main_layout.addWidget(self.gemini_group)
         proxy_group = QGroupBox("代理设置 (如果能直连gemini就不用管了)")
-        proxy_layout = QVBoxLayout()
+        self._proxy_layout = QVBoxLayout()
         proxy_group.setSizePolicy(
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed
         )
         self.proxy_checkbox = QCheckBox("启用代理")
-        proxy_layout.addWidget(self.proxy_checkbox)
-        self.proxy_details_widget = QWidget()
-        self.proxy_details_widget.setVisible(False)
-        proxy_details_layout = QHBoxLayout(self.proxy_details_widget)
-        proxy_details_layout.setContentsMargins(20, 0, 0, 0)
-        type_label = QLabel("类型: http/https")
-        host_label = QLabel("地址:")
-        self.proxy_host_edit = QLineEdit()
-        self.proxy_host_edit.setPlaceholderText("例如: 127.0.0.1")
-        port_label = QLabel("端口:")
-        self.proxy_port_edit = QLineEdit()
-        self.proxy_port_edit.setPlaceholderText("例如: 21524")
-        proxy_details_layout.addWidget(type_label)
-        proxy_details_layout.addSpacing(10)
-        proxy_details_layout.addWidget(host_label)
-        proxy_details_layout.addWidget(self.proxy_host_edit, 1)
-        proxy_details_layout.addSpacing(10)
-        proxy_details_layout.addWidget(port_label)
-        proxy_details_layout.addWidget(self.proxy_port_edit, 0)
-        proxy_layout.addWidget(self.proxy_details_widget)
-        proxy_group.setLayout(proxy_layout)
+        self._proxy_layout.addWidget(self.proxy_checkbox)
+        proxy_group.setLayout(self._proxy_layout)
         main_layout.addWidget(proxy_group)
         button_layout = QHBoxLayout()
         button_layout.addSpacerItem(
@@ -232,217 +271,282 @@ class SettingsDialog(QDialog):
         button_layout.addWidget(self.cancel_button)
         main_layout.addLayout(button_layout)
 
-    def _load_settings(self):
-        ocr_provider = self.config_manager.get(
-            "API", "ocr_provider", fallback="gemini"
-        ).lower()
-        self.primary_ocr_combo.setCurrentIndex(0 if ocr_provider == "gemini" else 1)
-        fallback_ocr_provider = self.config_manager.get(
-            "API", "fallback_ocr_provider", fallback="google cloud vision"
-        ).lower()
-        self.fallback_ocr_provider_combo.setCurrentIndex(
-            0 if "google" in fallback_ocr_provider else 0
-        )
-        self.gemini_api_key_edit.setText(
-            self.config_manager.get("GeminiAPI", "api_key", fallback="")
-        )
-        self.gemini_model_edit.setText(
-            self.config_manager.get(
-                "GeminiAPI", "model_name", fallback="gemini-1.5-flash-latest"
-            )
-        )
-        self.gemini_base_url_edit.setText(
-            self.config_manager.get("GeminiAPI", "gemini_base_url", fallback="")
+    def _ensure_fallback_ui(self):
+        if self.fallback_ocr_group is not None:
+            return
+        self.fallback_ocr_group = QGroupBox(
+            "回退 OCR 设置 (仅当主要 OCR 非 Gemini 时生效)"
         )
-        self.gemini_timeout_edit.setText(
-            self.config_manager.get("GeminiAPI", "request_timeout", fallback="60")
+        self.fallback_ocr_group.setSizePolicy(
+            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
         )
-        self.gemini_source_lang_edit.setText(
-            self.config_manager.get("GeminiAPI", "source_language", fallback="Japanese")
+        self.fallback_ocr_group.setVisible(False)
+        self._fallback_ocr_group_layout = QVBoxLayout(self.fallback_ocr_group)
+        fallback_ocr_provider_layout = QFormLayout()
+        self.fallback_ocr_provider_combo = QComboBox()
+        self.fallback_ocr_provider_combo.addItems(["Google Cloud Vision"])
+        self.fallback_ocr_provider_combo.setCurrentIndex(0)
+        fallback_ocr_provider_layout.addRow(
+            "回退 OCR Provider:", self.fallback_ocr_provider_combo
         )
-        self.gemini_target_lang_edit.setText(
-            self.config_manager.get("GeminiAPI", "target_language", fallback="Chinese")
+        self._fallback_ocr_group_layout.addLayout(fallback_ocr_provider_layout)
+        self._ocr_layout.addWidget(self.fallback_ocr_group)
+        self.fallback_ocr_provider_combo.currentIndexChanged.connect(
+            self._on_fallback_ocr_changed
         )
-        self.google_key_edit.setText(
-            self.config_manager.get("GoogleAPI", "service_account_json", fallback="")
+
+    def _ensure_google_ui(self):
+        if self.google_ocr_widget is not None:
+            return
+        self._ensure_fallback_ui()
+        self.google_ocr_widget = QWidget()
+        self.google_ocr_widget.setVisible(False)
+        google_ocr_layout = QHBoxLayout(self.google_ocr_widget)
+        google_key_label = QLabel("Google 服务账号 JSON:")
+        self.google_key_edit = QLineEdit()
+        self.google_key_button = QPushButton("浏览...")
+        google_ocr_layout.addWidget(google_key_label)
+        google_ocr_layout.addWidget(self.google_key_edit, 1)
+        google_ocr_layout.addWidget(self.google_key_button)
+        self._load_fields(("google_key_edit",))
+        self._fallback_ocr_group_layout.addWidget(self.google_ocr_widget)
+        self.google_key_button.clicked.connect(self._browse_google_key)
+
+    def _ensure_llm_preprocess_ui(self):
+        if self.llm_preprocess_details_widget is not None:
+            return
+        self.llm_preprocess_details_widget = QWidget()
+        self.llm_preprocess_details_widget.setVisible(False)
+        llm_preprocess_details_form_layout = QFormLayout(
+            self.llm_preprocess_details_widget
         )
-        proxy_enabled = self.config_manager.getboolean(
-            "Proxy", "enabled", fallback=False
+        llm_preprocess_details_form_layout.setContentsMargins(20, 0, 0, 0)
+        self.llm_upscale_factor_edit = QLineEdit()
+        self._defer_placeholder(
+            self.llm_upscale_factor_edit,
+            "太大会把文本拆分得很碎，推荐不超过1.5，推荐LANCZOS算法",
         )
-        self.proxy_checkbox.setChecked(proxy_enabled)
-        self.proxy_host_edit.setText(
-            self.config_manager.get("Proxy", "host", fallback="127.0.0.1")
+        llm_preprocess_details_form_layout.addRow(
+            "放大倍数:", self.llm_upscale_factor_edit
         )
-        self.proxy_port_edit.setText(
-            self.config_manager.get("Proxy", "port", fallback="21524")
+        self.llm_resample_method_combo = QComboBox()
+        self.llm_resample_method_combo.addItems(list(self._RESAMPLE_INDEX))
+        llm_preprocess_details_form_layout.addRow(
+            "放大采样方法:", self.llm_resample_method_combo
         )
-        llm_preprocess_enabled = self.config_manager.getboolean(
-            "LLMImagePreprocessing", "enabled", fallback=False
+        self.llm_contrast_factor_edit = QLineEdit()
+        self._defer_placeholder(
+            self.llm_contrast_factor_edit, "太大会让识别变得很困难，推荐不超过1.3"
         )
-        self.llm_preprocess_enabled_checkbox.setChecked(llm_preprocess_enabled)
-        self.llm_upscale_factor_edit.setText(
-            self.config_manager.get(
-                "LLMImagePreprocessing", "upscale_factor", fallback="1.0"
-            )
+        llm_preprocess_details_form_layout.addRow(
+            "对比度系数:", self.llm_contrast_factor_edit
         )
-        self.llm_contrast_factor_edit.setText(
-            self.config_manager.get(
-                "LLMImagePreprocessing", "contrast_factor", fallback="1.0"
+        self._load_fields(
+            (
+                "llm_upscale_factor_edit",
+                "llm_contrast_factor_edit",
+                "llm_resample_method_combo",
             )
         )
-        current_resample_method = self.config_manager.get(
-            "LLMImagePreprocessing", "upscale_resample_method", fallback="LANCZOS"
-        ).upper()
-        if current_resample_method in [
-            item.upper() for item in ["LANCZOS", "BICUBIC", "BILINEAR", "NEAREST"]
-        ]:
-            self.llm_resample_method_combo.setCurrentText(current_resample_method)
-        else:
-            self.llm_resample_method_combo.setCurrentText("LANCZOS")
-        self._toggle_proxy_details(
-            Qt.CheckState.Checked.value
-            if proxy_enabled
-            else Qt.CheckState.Unchecked.value
-        )
-        self._toggle_llm_preprocess_details(
-            Qt.CheckState.Checked.value
-            if llm_preprocess_enabled
-            else Qt.CheckState.Unchecked.value
-        )
+        self._llm_preprocess_layout.addWidget(self.llm_preprocess_details_widget)
+
+    def _ensure_proxy_details_ui(self):
+        if self.proxy_details_widget is not None:
+            return
+        self.proxy_details_widget = QWidget()
+        self.proxy_details_widget.setVisible(False)
+        proxy_details_layout = QHBoxLayout(self.proxy_details_widget)
+        proxy_details_layout.setContentsMargins(20, 0, 0, 0)
+        type_label = QLabel("类型: http/https")
+        host_label = QLabel("地址:")
+        self.proxy_host_edit = QLineEdit()
+        self._defer_placeholder(self.proxy_host_edit, "例如: 127.0.0.1")
+        port_label = QLabel("端口:")
+        self.proxy_port_edit = QLineEdit()
+        self._defer_placeholder(self.proxy_port_edit, "例如: 21524")
+        self._load_fields(("proxy_host_edit", "proxy_port_edit"))
+        proxy_details_layout.addWidget(type_label)
+        proxy_details_layout.addSpacing(10)
+        proxy_details_layout.addWidget(host_label)
+        proxy_details_layout.addWidget(self.proxy_host_edit, 1)
+        proxy_details_layout.addSpacing(10)
+        proxy_details_layout.addWidget(port_label)
+        proxy_details_layout.addWidget(self.proxy_port_edit, 0)
+        self._proxy_layout.addWidget(self.proxy_details_widget)
+
+    def _defer_placeholder(self, edit, text):
+        self._pending_placeholders.append((edit, text))
+
+    def _apply_placeholders(self):
+        still_pending = []
+        for edit, text in self._pending_placeholders:
+            if edit.isVisibleTo(self):
+                edit.setPlaceholderText(text)
+            else:
+                still_pending.append((edit, text))
+        self._pending_placeholders = still_pending
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_placeholders:
+            QTimer.singleShot(0, self._apply_placeholders)
+
+    def _load_settings(self):
+        self._loaded_values = self.config_manager.get_many(self._SETTINGS_SPEC)
+        values = self._loaded_values
+        self.primary_ocr_combo.blockSignals(True)
+        self.primary_ocr_combo.setCurrentIndex(
+            0 if values[("API", "ocr_provider")] == "gemini" else 1
+        )
+        self.primary_ocr_combo.blockSignals(False)
+        self._load_fields()
+        proxy_enabled = values[("Proxy", "enabled")]
+        llm_preprocess_enabled = values[("LLMImagePreprocessing", "enabled")]
+        self._toggle_proxy_details(proxy_enabled)
+        self._toggle_llm_preprocess_details(llm_preprocess_enabled)
         self._update_provider_sections_visibility()
 
+    def _load_fields(self, attrs=None):
+        for section, option, attr, kind, default in self._FIELD_SPECS:
+            if attrs is not None and attr not in attrs:
+                continue
+            widget = getattr(self, attr, None)
+            if widget is None:
+                continue
+            value = self._loaded_values[(section, option)]
+            if kind == "bool":
+                widget.setChecked(value)
+            elif kind == "resample":
+                widget.setCurrentIndex(
+                    self._RESAMPLE_INDEX.get(
+                        value.upper(), self._RESAMPLE_INDEX[default]
+                    )
+                )
+            else:
+                widget.setText(value)
+
+    def _set_if_changed(self, section, option, value):
+        loaded_value = self._loaded_values.get((section, option))
+        if isinstance(loaded_value, bool):
+            loaded_value = str(loaded_value)
+        if loaded_value == value:
+            return False
+        self.config_manager.set(section, option, value)
+        return True
+
     def _save_settings(self):
-        self.config_manager.set(
+        changed = False
+        changed |= self._set_if_changed(
             "API",
             "ocr_provider",
             "gemini" if self.primary_ocr_combo.currentIndex() == 0 else "fallback",
         )
-        if self.fallback_ocr_provider_combo.count() > 0:
-            self.config_manager.set(
-                "API", "fallback_ocr_provider", "google cloud vision"
-            )
-        else:
-            self.config_manager.set(
-                "API", "fallback_ocr_provider", "google cloud vision"
-            )
-        self.config_manager.set("API", "translation_provider", "gemini")
-        self.config_manager.set("GeminiAPI", "api_key", self.gemini_api_key_edit.text())
-        self.config_manager.set(
-            "GeminiAPI",
-            "model_name",
-            self.gemini_model_edit.text().strip() or "gemini-1.5-flash-latest",
-        )
-        self.config_manager.set(
-            "GeminiAPI",
-            "request_timeout",
-            self.gemini_timeout_edit.text().strip() or "60",
-        )
-        self.config_manager.set(
-            "GeminiAPI", "gemini_base_url", self.gemini_base_url_edit.text().strip()
-        )
-        self.config_manager.set(
-            "GeminiAPI",
-            "source_language",
-            self.gemini_source_lang_edit.text().strip() or "Japanese",
-        )
-        self.config_manager.set(
-            "GeminiAPI",
-            "target_language",
-            self.gemini_target_lang_edit.text().strip() or "Chinese",
-        )
-        self.config_manager.set(
-            "GoogleAPI", "service_account_json", self.google_key_edit.text()
-        )
-        self.config_manager.set(
-            "Proxy", "enabled", str(self.proxy_checkbox.isChecked())
-        )
-        self.config_manager.set("Proxy", "type", "http")
-        self.config_manager.set(
-            "Proxy", "host", self.proxy_host_edit.text().strip() or "127.0.0.1"
-        )
-        self.config_manager.set(
-            "Proxy", "port", self.proxy_port_edit.text().strip() or "21524"
-        )
-        self.config_manager.set(
-            "LLMImagePreprocessing",
-            "enabled",
-            str(self.llm_preprocess_enabled_checkbox.isChecked()),
-        )
-        self.config_manager.set(
-            "LLMImagePreprocessing",
-            "upscale_factor",
-            self.llm_upscale_factor_edit.text().strip() or "1.0",
-        )
-        self.config_manager.set(
-            "LLMImagePreprocessing",
-            "contrast_factor",
-            self.llm_contrast_factor_edit.text().strip() or "1.0",
-        )
-        self.config_manager.set(
-            "LLMImagePreprocessing",
-            "upscale_resample_method",
-            self.llm_resample_method_combo.currentText(),
-        )
+        changed |= self._set_if_changed(
+            "API", "fallback_ocr_provider", "google cloud vision"
+        )
+        changed |= self._set_if_changed("API", "translation_provider", "gemini")
+        changed |= self._set_if_changed("Proxy", "type", "http")
+        for section, option, attr, kind, default in self._FIELD_SPECS:
+            widget = getattr(self, attr, None)
+            if widget is None:
+                continue
+            if kind == "bool":
+                value = str(widget.isChecked())
+            elif kind == "resample":
+                value = widget.currentText()
+            elif kind == "raw_text":
+                value = widget.text()
+            else:
+                value = widget.text().strip() or default
+            changed |= self._set_if_changed(section, option, value)
+        self.settings_changed = changed
         return True
 
     def _connect_signals(self):
         self.save_button.clicked.connect(self.on_save)
         self.cancel_button.clicked.connect(self.reject)
-        self.proxy_checkbox.stateChanged.connect(self._toggle_proxy_details)
-        self.llm_preprocess_enabled_checkbox.stateChanged.connect(
+        self.proxy_checkbox.toggled.connect(self._toggle_proxy_details)
+        self.llm_preprocess_enabled_checkbox.toggled.connect(
             self._toggle_llm_preprocess_details
         )
-        self.google_key_button.clicked.connect(self._browse_google_key)
-        self.primary_ocr_combo.currentIndexChanged.connect(
-            self._update_provider_sections_visibility
-        )
-        self.fallback_ocr_provider_combo.currentIndexChanged.connect(
-            self._update_provider_sections_visibility
-        )
+        self.primary_ocr_combo.currentIndexChanged.connect(self._on_primary_ocr_changed)
 
-    def _toggle_proxy_details(self, state):
-        is_checked = False
-        if isinstance(state, Qt.CheckState):
-            is_checked = state == Qt.CheckState.Checked
-        elif isinstance(state, int):
-            is_checked = state == Qt.CheckState.Checked.value
-        elif isinstance(state, bool):
-            is_checked = state
-        self.proxy_details_widget.setVisible(is_checked)
-        self.adjustSize()
+    @pyqtSlot(bool)
+    def _toggle_proxy_details(self, is_checked):
+        if is_checked:
+            self._ensure_proxy_details_ui()
+        if self.proxy_details_widget is not None:
+            self.proxy_details_widget.setVisible(is_checked)
+        if is_checked and self._pending_placeholders:
+            self._apply_placeholders()
+        self._schedule_adjust_size()
 
-    def _toggle_llm_preprocess_details(self, state):
-        is_checked = False
-        if isinstance(state, Qt.CheckState):
-            is_checked = state == Qt.CheckState.Checked
-        elif isinstance(state, int):
-            is_checked = state == Qt.CheckState.Checked.value
-        elif isinstance(state, bool):
-            is_checked = state
-        self.llm_preprocess_details_widget.setVisible(is_checked)
-        self.adjustSize()
+    @pyqtSlot(bool)
+    def _toggle_llm_preprocess_details(self, is_checked):
+        if is_checked:
+            self._ensure_llm_preprocess_ui()
+        if self.llm_preprocess_details_widget is not None:
+            self.llm_preprocess_details_widget.setVisible(is_checked)
+        if is_checked and self._pending_placeholders:
+            self._apply_placeholders()
+        self._schedule_adjust_size()
 
     def _update_provider_sections_visibility(self):
-        is_gemini_ocr_primary = self.primary_ocr_combo.currentIndex() == 0
-        show_fallback_ocr_group_flag = not is_gemini_ocr_primary
-        if self.fallback_ocr_group.isVisible() != show_fallback_ocr_group_flag:
-            self.fallback_ocr_group.setVisible(show_fallback_ocr_group_flag)
+        if not self.gemini_group.isVisible():
+            self.gemini_group.setVisible(True)
+        self._on_primary_ocr_changed(self.primary_ocr_combo.currentIndex())
+
+    @pyqtSlot(int)
+    def _on_primary_ocr_changed(self, index):
+        show_fallback_ocr_group_flag = index != 0
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_primary_ocr_visibility(show_fallback_ocr_group_flag)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+        self._schedule_adjust_size()
+
+    def _apply_primary_ocr_visibility(self, show_fallback_ocr_group_flag):
         if show_fallback_ocr_group_flag:
-            is_google_selected_for_fallback_ocr = (
+            self._ensure_fallback_ui()
+            if not self.fallback_ocr_group.isVisible():
+                self.fallback_ocr_group.setVisible(True)
+            self._apply_fallback_ocr_visibility(
                 self.fallback_ocr_provider_combo.currentIndex() == 0
-                and self.fallback_ocr_provider_combo.count() > 0
             )
-            if (
-                self.google_ocr_widget.isVisible()
-                != is_google_selected_for_fallback_ocr
-            ):
-                self.google_ocr_widget.setVisible(is_google_selected_for_fallback_ocr)
-        else:
-            self.google_ocr_widget.setVisible(False)
-        show_gemini_api_settings_group_flag = is_gemini_ocr_primary or True
-        if self.gemini_group.isVisible() != show_gemini_api_settings_group_flag:
-            self.gemini_group.setVisible(show_gemini_api_settings_group_flag)
-        QApplication.processEvents()
+        elif self.fallback_ocr_group is not None:
+            self.fallback_ocr_group.setVisible(False)
+            if self.google_ocr_widget is not None:
+                self.google_ocr_widget.setVisible(False)
+
+    @pyqtSlot(int)
+    def _on_fallback_ocr_changed(self, index):
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_fallback_ocr_visibility(index == 0)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+        self._schedule_adjust_size()
+
+    def _apply_fallback_ocr_visibility(self, is_google_selected_for_fallback_ocr):
+        if is_google_selected_for_fallback_ocr:
+            self._ensure_google_ui()
+        if (
+            self.google_ocr_widget is not None
+            and self.google_ocr_widget.isVisible()
+            != is_google_selected_for_fallback_ocr
+        ):
+            self.google_ocr_widget.setVisible(is_google_selected_for_fallback_ocr)
+
+    def _schedule_adjust_size(self):
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._do_adjust_size)
+
+    def _do_adjust_size(self):
+        self._resize_pending = False
         self.layout().activate()
         self.adjustSize()
 
@@ -453,117 +557,49 @@ class SettingsDialog(QDialog):
             if current_path and os.path.exists(os.path.dirname(current_path))
             else os.path.expanduser("~")
         )
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "选择 Google 服务账号 JSON 文件",
-            start_dir,
-            "JSON 文件 (*.json);;所有文件 (*)",
-        )
-        if file_path:
-            self.google_key_edit.setText(file_path)
+        if self._google_file_dialog is None:
+            self._google_file_dialog = QFileDialog(
+                self, "选择 Google 服务账号 JSON 文件"
+            )
+            self._google_file_dialog.setNameFilter("JSON 文件 (*.json);;所有文件 (*)")
+            self._google_file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        self._google_file_dialog.setDirectory(start_dir)
+        if self._google_file_dialog.exec():
+            selected_files = self._google_file_dialog.selectedFiles()
+            if selected_files:
+                self.google_key_edit.setText(selected_files[0])
 
     @pyqtSlot()
     def on_save(self):
-        if self.proxy_checkbox.isChecked():
-            if not self.proxy_host_edit.text().strip():
-                QMessageBox.warning(self, "输入错误", "启用了代理，但代理地址为空。")
-                self.proxy_host_edit.setFocus()
-                return
-            if not self.proxy_port_edit.text().strip().isdigit():
-                QMessageBox.warning(self, "输入错误", "代理端口必须是一个有效的数字。")
-                self.proxy_port_edit.setFocus()
-                return
-        is_gemini_primary_ocr = self.primary_ocr_combo.currentIndex() == 0
-        if True:
-            if not self.gemini_api_key_edit.text().strip():
-                QMessageBox.warning(self, "输入错误", "Gemini API Key 未填写。")
-                self.gemini_api_key_edit.setFocus()
-                return
-            if not self.gemini_source_lang_edit.text().strip():
-                QMessageBox.warning(self, "输入错误", "Gemini 源语言未填写。")
-                self.gemini_source_lang_edit.setFocus()
-                return
-            if not self.gemini_target_lang_edit.text().strip():
-                QMessageBox.warning(self, "输入错误", "Gemini 目标翻译语言未填写。")
-                self.gemini_target_lang_edit.setFocus()
-                return
-        gemini_timeout_str = self.gemini_timeout_edit.text().strip()
-        if gemini_timeout_str and (
-            not gemini_timeout_str.isdigit() or int(gemini_timeout_str) <= 0
-        ):
-            QMessageBox.warning(self, "输入错误", "Gemini 请求超时必须是一个正整数。")
-            self.gemini_timeout_edit.setFocus()
-            return
-        gemini_base_url_str = self.gemini_base_url_edit.text().strip()
-        if gemini_base_url_str and not (
-            gemini_base_url_str.startswith("http://")
-            or gemini_base_url_str.startswith("https://")
-        ):
-            QMessageBox.warning(
-                self,
-                "输入错误",
-                "Gemini Base URL 如果填写，必须以 http:// 或 https:// 开头。",
-            )
-            self.gemini_base_url_edit.setFocus()
-            return
-        if self.llm_preprocess_enabled_checkbox.isChecked():
-            try:
-                upscale_f = float(self.llm_upscale_factor_edit.text().strip())
-                if upscale_f < 0.1:
-                    raise ValueError("Upscale factor too small or negative")
-            except ValueError:
-                QMessageBox.warning(
-                    self,
-                    "输入错误",
-                    "LLM 图像放大倍数必须是一个有效的正数 (例如 1.0, 1.5)。",
-                )
-                self.llm_upscale_factor_edit.setFocus()
-                return
-            try:
-                contrast_f = float(self.llm_contrast_factor_edit.text().strip())
-                if contrast_f < 0.1:
-                    raise ValueError("Contrast factor too small or negative")
-            except ValueError:
-                QMessageBox.warning(
-                    self,
-                    "输入错误",
-                    "LLM 图像对比度系数必须是一个有效的正数 (例如 1.0, 1.2)。",
-                )
-                self.llm_contrast_factor_edit.setFocus()
+        for is_valid, field_name, message in self._VALIDATORS:
+            if not is_valid(self):
+                QMessageBox.warning(self, "输入错误", message)
+                getattr(self, field_name).setFocus()
                 return
         if self._save_settings():
+            env = os.environ
             if self.proxy_checkbox.isChecked():
                 proxy_host = self.proxy_host_edit.text().strip()
                 proxy_port = self.proxy_port_edit.text().strip()
                 if proxy_host and proxy_port:
                     proxy_url = f"http://{proxy_host}:{proxy_port}"
-                    os.environ["HTTPS_PROXY"] = proxy_url
-                    os.environ["HTTP_PROXY"] = proxy_url
+                    env.update({"HTTPS_PROXY": proxy_url, "HTTP_PROXY": proxy_url})
                     print(
                         f"SettingsDialog: Applied proxy to environment: HTTPS_PROXY/HTTP_PROXY = {proxy_url}"
                     )
                 else:
-                    if "HTTPS_PROXY" in os.environ:
-                        del os.environ["HTTPS_PROXY"]
-                    if "HTTP_PROXY" in os.environ:
-                        del os.environ["HTTP_PROXY"]
+                    env.pop("HTTPS_PROXY", None)
+                    env.pop("HTTP_PROXY", None)
                     print(
                         "SettingsDialog: Proxy enabled but host/port invalid. Cleared HTTPS_PROXY/HTTP_PROXY."
                     )
             else:
-                current_https_proxy = os.environ.get("HTTPS_PROXY", "")
-                current_http_proxy = os.environ.get("HTTP_PROXY", "")
-                proxy_host_check = self.config_manager.get("Proxy", "host", "")
-                if "HTTPS_PROXY" in os.environ and (
-                    current_https_proxy.startswith("http://127.0.0.1")
-                    or (proxy_host_check and proxy_host_check in current_https_proxy)
-                ):
-                    del os.environ["HTTPS_PROXY"]
-                if "HTTP_PROXY" in os.environ and (
-                    current_http_proxy.startswith("http://127.0.0.1")
-                    or (proxy_host_check and proxy_host_check in current_http_proxy)
-                ):
-                    del os.environ["HTTP_PROXY"]
+                proxy_host_check = self.config_manager.get("Proxy", "host", "").strip()
+                if proxy_host_check:
+                    needle = f"{proxy_host_check}:"
+                    for env_key in ("HTTPS_PROXY", "HTTP_PROXY"):
+                        if needle in env.get(env_key, ""):
+                            env.pop(env_key, None)
                 print(
                     "SettingsDialog: Proxy disabled. Ensured related env vars potentially set by app are cleared."
                 )
@@ -604,6 +640,16 @@ if __name__ == "__main__":
             except (ValueError, TypeError):
                 return fallback
 
+        def get_many(self, spec):
+            return {
+                (s, o): (
+                    self.getboolean(s, o, fallback)
+                    if kind == "bool"
+                    else self.get(s, o, fallback)
+                )
+                for s, o, fallback, kind in spec
+            }
+
         def set(self, s, o, v):
             self.data.setdefault(s, {})[o] = str(v)
 
@@ -614,29 +660,13 @@ if __name__ == "__main__":
             return None
 
     app = QApplication(sys.argv)
-    if not os.path.exists("config.ini"):
-        print("Creating dummy config.ini for testing.")
-        dummy_cfg_manager = DummyCM("config.ini")
-        dummy_cfg_manager.set("API", "ocr_provider", "gemini")
-        dummy_cfg_manager.set("API", "translation_provider", "gemini")
-        dummy_cfg_manager.set("GeminiAPI", "api_key", "TEST_API_KEY")
-        dummy_cfg_manager.set("GeminiAPI", "model_name", "gemini-1.5-flash-latest")
-        dummy_cfg_manager.set("GeminiAPI", "source_language", "Japanese")
-        dummy_cfg_manager.set("GeminiAPI", "target_language", "Chinese")
-        dummy_cfg_manager.set("LLMImagePreprocessing", "enabled", "False")
-        dummy_cfg_manager.set("LLMImagePreprocessing", "upscale_factor", "1.5")
-        dummy_cfg_manager.set("LLMImagePreprocessing", "contrast_factor", "1.2")
-        dummy_cfg_manager.set(
-            "LLMImagePreprocessing", "upscale_resample_method", "LANCZOS"
-        )
-        dummy_cfg_manager.set("Proxy", "enabled", "False")
-        dummy_cfg_manager.set("Proxy", "host", "127.0.0.1")
-        dummy_cfg_manager.set("Proxy", "port", "21524")
-        cfg_manager = dummy_cfg_manager
-    else:
+    if os.path.exists("config.ini"):
         from config_manager import ConfigManager as RealCM
 
         cfg_manager = RealCM("config.ini")
+    else:
+        cfg_manager = DummyCM("config.ini")
     dialog = SettingsDialog(cfg_manager)
+    dialog.accepted.connect(cfg_manager.save)
     dialog.show()
     sys.exit(app.exec())
@@ -8,10 +8,18 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSizePolicy,
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QEvent
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
 from PyQt6.QtGui import QTextCursor
 
 
+class _TranslatedTextEdit(QTextEdit):
+    focusLost = pyqtSignal()
+
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)
+        self.focusLost.emit()
+
+
 class TextDetailPanel(QWidget):
     translated_text_changed_externally_signal = pyqtSignal(str)
 
@@ -19,6 +27,8 @@ class TextDetailPanel(QWidget):
         super().__init__(parent)
         self._current_block_id = None
         self._programmatic_update = False
+        self._last_original_text = ""
+        self._last_translated_text = ""
         self._init_ui()
 
     def _init_ui(self):
@@ -33,9 +43,9 @@ class TextDetailPanel(QWidget):
         main_layout.addWidget(original_text_group)
         translated_text_group = QGroupBox("译文")
         translated_text_layout = QVBoxLayout(translated_text_group)
-        self.translated_text_edit = QTextEdit()
+        self.translated_text_edit = _TranslatedTextEdit()
         self.translated_text_edit.setPlaceholderText("选中翻译的翻译文本")
-        self.translated_text_edit.installEventFilter(self)
+        self.translated_text_edit.focusLost.connect(self._on_translated_focus_out)
         translated_text_layout.addWidget(self.translated_text_edit)
         main_layout.addWidget(translated_text_group)
         self.original_text_edit.setMinimumHeight(100)
@@ -53,13 +63,11 @@ class TextDetailPanel(QWidget):
             QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding
         )
 
-    def eventFilter(self, obj, event):
-        if obj is self.translated_text_edit:
-            if event.type() == QEvent.Type.FocusOut:
-                if self._current_block_id is not None and not self._programmatic_update:
-                    new_text = self.translated_text_edit.toPlainText()
-                    self.translated_text_changed_externally_signal.emit(new_text)
-        return super().eventFilter(obj, event)
+    @pyqtSlot()
+    def _on_translated_focus_out(self):
+        if self._current_block_id is not None and not self._programmatic_update:
+            new_text = self.translated_text_edit.toPlainText()
+            self.translated_text_changed_externally_signal.emit(new_text)
 
     def update_texts(
         self,
@@ -68,15 +76,21 @@ class TextDetailPanel(QWidget):
         block_id: str | int | None,
     ):
         self._programmatic_update = True
-        current_displayed_original = self.original_text_edit.toPlainText()
-        current_displayed_translated = self.translated_text_edit.toPlainText()
         new_original = original_text if original_text is not None else ""
         new_translated = translated_text if translated_text is not None else ""
-        if current_displayed_original != new_original:
+        if self._last_original_text != new_original:
+            self.original_text_edit.blockSignals(True)
             self.original_text_edit.setPlainText(new_original)
-        if current_displayed_translated != new_translated:
-            old_cursor_pos = self.translated_text_edit.textCursor().position()
+            self.original_text_edit.blockSignals(False)
+            self._last_original_text = new_original
+        if (
+            self._last_translated_text != new_translated
+            or self.translated_text_edit.document().isModified()
+        ):
+            self.translated_text_edit.blockSignals(True)
             self.translated_text_edit.setPlainText(new_translated)
+            self.translated_text_edit.blockSignals(False)
+            self._last_translated_text = new_translated
         self._current_block_id = block_id
         self._programmatic_update = False
 
@@ -85,6 +99,8 @@ class TextDetailPanel(QWidget):
         self._current_block_id = None
         self.original_text_edit.clear()
         self.translated_text_edit.clear()
+        self._last_original_text = ""
+        self._last_translated_text = ""
         self._programmatic_update = False
 
     def get_current_translated_text(self) -> str:
@@ -1,5 +1,6 @@
 import os
 import sys
+from functools import lru_cache
 
 try:
     from PIL import ImageFont, ImageDraw
@@ -10,12 +11,56 @@ except ImportError:
     ImageFont = None
     ImageDraw = None
     print("警告(font_utils): Pillow 库未安装，字体处理功能将受限。")
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+_VECTORIZED_WRAP_MIN_CHARS = 256
+_FONT_DIR_INDEX: dict[str, dict[str, str]] = {}
+
+
+def _font_dir_index(base_path: str) -> dict[str, str]:
+    index = _FONT_DIR_INDEX.get(base_path)
+    if index is None:
+        index = {}
+        try:
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        index.setdefault(entry.name.lower(), entry.path)
+        except OSError:
+            pass
+        _FONT_DIR_INDEX[base_path] = index
+    return index
 
 
+def _lookup_in_index(
+    filename_candidates: list[str], system_font_paths: list[str]
+) -> str | None:
+    for filename in filename_candidates:
+        filename_lower = filename.lower()
+        for base_path in system_font_paths:
+            found_path = _font_dir_index(base_path).get(filename_lower)
+            if found_path:
+                return found_path
+    return None
+
+
+@lru_cache(maxsize=256)
+def _font_file_exists(font_path: str) -> bool:
+    return os.path.exists(font_path)
+
+
+@lru_cache(maxsize=128)
 def find_font_path(font_name_or_path: str) -> str | None:
     if not PILLOW_AVAILABLE:
         return None
-    if os.path.isabs(font_name_or_path) and os.path.exists(font_name_or_path):
+    if os.path.isabs(font_name_or_path) and _font_file_exists(font_name_or_path):
         return font_name_or_path
     system_font_paths = []
     if sys.platform == "win32":
@@ -44,63 +89,24 @@ def find_font_path(font_name_or_path: str) -> str | None:
         font_name_lower.endswith(ext) for ext in [".ttf", ".otf", ".ttc"]
     )
     if not has_extension:
-        for ext_to_try in [".ttf", ".otf", ".ttc"]:
-            font_file_to_try = font_name_or_path + ext_to_try
-            for base_path in system_font_paths:
-                if os.path.isdir(base_path):
-                    potential_path = os.path.join(base_path, font_file_to_try)
-                    if os.path.exists(potential_path):
-                        return potential_path
-                    try:
-                        for f_name in os.listdir(base_path):
-                            if f_name.lower() == font_file_to_try.lower():
-                                potential_path_case_insensitive = os.path.join(
-                                    base_path, f_name
-                                )
-                                if os.path.exists(potential_path_case_insensitive):
-                                    return potential_path_case_insensitive
-                    except OSError:
-                        pass
-    else:
-        for base_path in system_font_paths:
-            if os.path.isdir(base_path):
-                potential_path = os.path.join(base_path, font_name_or_path)
-                if os.path.exists(potential_path):
-                    return potential_path
-                try:
-                    for f_name in os.listdir(base_path):
-                        if f_name.lower() == font_name_or_path.lower():
-                            potential_path_case_insensitive = os.path.join(
-                                base_path, f_name
-                            )
-                            if os.path.exists(potential_path_case_insensitive):
-                                return potential_path_case_insensitive
-                except OSError:
-                    pass
-    if has_extension and not font_name_lower.endswith(".ttc"):
+        filename_candidates = [
+            font_name_or_path + ext_to_try for ext_to_try in [".ttf", ".otf", ".ttc"]
+        ]
+    elif not font_name_lower.endswith(".ttc"):
         base_name_no_ext, _ = os.path.splitext(font_name_or_path)
-        font_file_to_try_ttc = base_name_no_ext + ".ttc"
-        for base_path in system_font_paths:
-            if os.path.isdir(base_path):
-                potential_path = os.path.join(base_path, font_file_to_try_ttc)
-                if os.path.exists(potential_path):
-                    return potential_path
-                try:
-                    for f_name in os.listdir(base_path):
-                        if f_name.lower() == font_file_to_try_ttc.lower():
-                            potential_path_case_insensitive = os.path.join(
-                                base_path, f_name
-                            )
-                            if os.path.exists(potential_path_case_insensitive):
-                                return potential_path_case_insensitive
-                except OSError:
-                    pass
+        filename_candidates = [font_name_or_path, base_name_no_ext + ".ttc"]
+    else:
+        filename_candidates = [font_name_or_path]
+    found_path = _lookup_in_index(filename_candidates, system_font_paths)
+    if found_path:
+        return found_path
     print(
         f"警告(find_font_path): 字体 '{font_name_or_path}' 未在标准路径或作为绝对路径找到。"
     )
     return None
 
 
+@lru_cache(maxsize=128)
 def get_pil_font(
     font_path_or_name: str | None, size: int, font_index: int = 0
 ) -> ImageFont.FreeTypeFont | ImageFont.ImageFont | None:
@@ -113,7 +119,7 @@ def get_pil_font(
             actual_font_path = resolved_path
     try:
         if actual_font_path and (
-            os.path.exists(actual_font_path) or not os.path.isabs(actual_font_path)
+            not os.path.isabs(actual_font_path) or _font_file_exists(actual_font_path)
         ):
             return ImageFont.truetype(actual_font_path, size, index=font_index)
         else:
@@ -129,6 +135,24 @@ def get_pil_font(
             return None
 
 
+@lru_cache(maxsize=64)
+def _font_char_widths(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+) -> dict[str, float]:
+    return {}
+
+
+@lru_cache(maxsize=256)
+def _font_em_width(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, default_size: int
+) -> float:
+    try:
+        em_width = font.getlength("M")
+    except Exception:
+        em_width = 0
+    return em_width or getattr(font, "size", 0) or default_size
+
+
 def get_font_line_height(
     font: ImageFont.FreeTypeFont | ImageFont.ImageFont | None,
     default_size: int = 16,
@@ -136,6 +160,31 @@ def get_font_line_height(
 ) -> int:
     if not PILLOW_AVAILABLE or not font:
         return int(default_size * 1.2) + vertical_spacing_px
+    return _font_base_line_height(font, default_size) + vertical_spacing_px
+
+
+@lru_cache(maxsize=256)
+def _font_base_line_height(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, default_size: int
+) -> int:
+    if isinstance(font, ImageFont.FreeTypeFont):
+        try:
+            bbox = font.getbbox("AgyQÍ M")
+        except Exception:
+            return _slow_line_height(font, default_size)
+        calculated_height = bbox[3] - bbox[1]
+        if calculated_height > 0:
+            line_height = calculated_height + max(1, int(font.size * 0.15))
+        else:
+            line_height = int(font.size * 1.25)
+        if line_height > 0:
+            return max(line_height, int(font.size * 0.5))
+    return _slow_line_height(font, default_size)
+
+
+def _slow_line_height(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, default_size: int
+) -> int:
     line_height = 0
     font_size_from_font = default_size
     if hasattr(font, "size"):
@@ -143,9 +192,7 @@ def get_font_line_height(
     try:
         if hasattr(font, "getbbox"):
             bbox = font.getbbox("AgyQÍ M")
-            ascent = abs(bbox[1])
-            descent = bbox[3]
-            calculated_height = descent - bbox[1]
+            calculated_height = bbox[3] - bbox[1]
             if calculated_height > 0:
                 leading = max(1, int(font_size_from_font * 0.15))
                 line_height = calculated_height + leading
@@ -164,10 +211,69 @@ def get_font_line_height(
     except Exception as e:
         print(f"警告(get_font_line_height): 获取字体指标时出错: {e}。使用后备值。")
         line_height = int(font_size_from_font * 1.20)
-    final_line_height = (
-        max(int(line_height), int(font_size_from_font * 0.5)) + vertical_spacing_px
+    return max(int(line_height), int(font_size_from_font * 0.5))
+
+
+def _wrap_paragraph(
+    paragraph: str,
+    char_w_cache: dict[str, float],
+    max_dim: int,
+    char_spacing_px: int,
+) -> tuple[list[str], float]:
+    lines = []
+    max_line_width = 0
+    line_start = 0
+    line_width = 0.0
+    spacing_before_char = 0
+    for char_idx, char_w in enumerate(map(char_w_cache.__getitem__, paragraph)):
+        test_width = line_width + char_w + spacing_before_char
+        if test_width <= max_dim or char_idx == line_start:
+            line_width = test_width
+        else:
+            lines.append(paragraph[line_start:char_idx])
+            max_line_width = max(max_line_width, line_width)
+            line_start = char_idx
+            line_width = char_w
+        spacing_before_char = char_spacing_px
+    lines.append(paragraph[line_start:])
+    return lines, max(max_line_width, line_width)
+
+
+def _wrap_paragraph_vectorized(
+    paragraph: str,
+    char_w_cache: dict[str, float],
+    max_dim: int,
+    char_spacing_px: int,
+) -> tuple[list[str], float]:
+    cumulative_widths = np.cumsum(
+        np.fromiter(
+            map(char_w_cache.__getitem__, paragraph),
+            dtype=np.float64,
+            count=len(paragraph),
+        )
+        + char_spacing_px
     )
-    return final_line_height
+    lines = []
+    max_line_width = 0
+    line_start = 0
+    while line_start < len(paragraph):
+        line_offset = cumulative_widths[line_start - 1] if line_start else 0.0
+        line_end = int(
+            np.searchsorted(
+                cumulative_widths,
+                line_offset + max_dim + char_spacing_px,
+                side="right",
+            )
+        )
+        if line_end <= line_start:
+            line_end = line_start + 1
+        lines.append(paragraph[line_start:line_end])
+        line_width = float(
+            cumulative_widths[line_end - 1] - line_offset - char_spacing_px
+        )
+        max_line_width = max(max_line_width, line_width)
+        line_start = line_end
+    return lines, max_line_width
 
 
 def wrap_text_pil(
@@ -216,16 +322,7 @@ def wrap_text_pil(
             )
             avg_char_width_approx = default_font_size
             if text and font:
-                try:
-                    avg_char_width_approx = (
-                        font.getlength("M") if hasattr(font, "getlength") else font.size
-                    )
-                except:
-                    avg_char_width_approx = (
-                        font.size if hasattr(font, "size") else default_font_size
-                    )
-                if avg_char_width_approx == 0:
-                    avg_char_width_approx = default_font_size
+                avg_char_width_approx = _font_em_width(font, default_font_size)
             return (
                 [text] if text else [],
                 int(avg_char_width_approx) if text else 0,
@@ -237,59 +334,41 @@ def wrap_text_pil(
         single_segment_dim_secondary = get_font_line_height(
             font, default_font_size, line_or_col_spacing_px
         )
-        current_line_text = ""
+        if hasattr(font, "getlength"):
+            measure_text = font.getlength
+            char_w_cache = _font_char_widths(font)
+        else:
+
+            def measure_text(text_to_measure: str) -> float:
+                return draw.textlength(text_to_measure, font=font)
+
+            char_w_cache: dict[str, float] = {}
+        if (
+            NUMPY_AVAILABLE
+            and char_spacing_px >= 0
+            and len(text) >= _VECTORIZED_WRAP_MIN_CHARS
+        ):
+            wrap_paragraph = _wrap_paragraph_vectorized
+        else:
+            wrap_paragraph = _wrap_paragraph
         max_line_width_achieved = 0
-        current_char_idx = 0
-        while current_char_idx < len(text):
-            char_val = text[current_char_idx]
-            if char_val == "\n":
-                if current_line_text:
-                    output_segments.append(current_line_text)
-                    current_w = draw.textlength(current_line_text, font=font) + (
-                        char_spacing_px * (len(current_line_text) - 1)
-                        if len(current_line_text) > 1 and char_spacing_px != 0
-                        else 0
-                    )
-                    max_line_width_achieved = max(max_line_width_achieved, current_w)
+        for paragraph_idx, paragraph in enumerate(text.split("\n")):
+            if paragraph_idx:
                 output_segments.append("")
-                current_line_text = ""
-                current_char_idx += 1
+            if not paragraph:
                 continue
-            test_line = current_line_text + char_val
-            current_test_width = draw.textlength(test_line, font=font)
-            if len(test_line) > 1 and char_spacing_px != 0:
-                current_test_width += char_spacing_px * (len(test_line) - 1)
-            if current_test_width <= max_dim:
-                current_line_text = test_line
-                current_char_idx += 1
-            else:
-                if current_line_text:
-                    output_segments.append(current_line_text)
-                    current_w = draw.textlength(current_line_text, font=font) + (
-                        char_spacing_px * (len(current_line_text) - 1)
-                        if len(current_line_text) > 1 and char_spacing_px != 0
-                        else 0
-                    )
-                    max_line_width_achieved = max(max_line_width_achieved, current_w)
-                    current_line_text = ""
-                if not current_line_text:
-                    current_line_text = char_val
-                    current_char_idx += 1
-        if current_line_text:
-            output_segments.append(current_line_text)
-            current_w = draw.textlength(current_line_text, font=font) + (
-                char_spacing_px * (len(current_line_text) - 1)
-                if len(current_line_text) > 1 and char_spacing_px != 0
-                else 0
+            for char_val in set(paragraph).difference(char_w_cache):
+                char_w_cache[char_val] = measure_text(char_val)
+            paragraph_lines, paragraph_width = wrap_paragraph(
+                paragraph, char_w_cache, max_dim, char_spacing_px
             )
-            max_line_width_achieved = max(max_line_width_achieved, current_w)
+            output_segments.extend(paragraph_lines)
+            max_line_width_achieved = max(max_line_width_achieved, paragraph_width)
         if not output_segments and text:
             output_segments = [text]
-            max_line_width_achieved = draw.textlength(text, font=font) + (
-                char_spacing_px * (len(text) - 1)
-                if len(text) > 1 and char_spacing_px != 0
-                else 0
-            )
+            max_line_width_achieved = draw.textlength(
+                text, font=font
+            ) + char_spacing_px * max(0, len(text) - 1)
         total_dim_primary = 0
         if output_segments:
             total_dim_primary = len(output_segments) * single_segment_dim_secondary
@@ -305,50 +384,23 @@ def wrap_text_pil(
         single_char_height_in_col_with_spacing = get_font_line_height(
             font, default_font_size, char_spacing_px
         )
-        try:
-            col_width_metric_for_total = font.getlength("M")
-            if col_width_metric_for_total == 0:
-                col_width_metric_for_total = (
-                    font.size if hasattr(font, "size") else default_font_size
-                )
-        except AttributeError:
-            col_width_metric_for_total = (
-                font.size if hasattr(font, "size") else default_font_size
+        col_width_metric_for_total = _font_em_width(font, default_font_size)
+        if single_char_height_in_col_with_spacing > 0:
+            chars_per_col = max(
+                1, int(max_dim // single_char_height_in_col_with_spacing)
             )
-        if col_width_metric_for_total == 0:
-            col_width_metric_for_total = default_font_size
-        current_col_chars_list = []
-        current_col_pixel_height = 0
-        max_col_height_achieved = 0
-        for char_val in text:
-            if char_val == "\n":
-                if current_col_chars_list:
-                    output_segments.append("".join(current_col_chars_list))
-                    max_col_height_achieved = max(
-                        max_col_height_achieved, current_col_pixel_height
-                    )
+        else:
+            chars_per_col = len(text)
+        longest_col_len = 0
+        for paragraph_idx, paragraph in enumerate(text.split("\n")):
+            if paragraph_idx:
                 output_segments.append("")
-                current_col_chars_list = []
-                current_col_pixel_height = 0
-                continue
-            if not current_col_chars_list or (
-                current_col_pixel_height + single_char_height_in_col_with_spacing
-                <= max_dim
-            ):
-                current_col_chars_list.append(char_val)
-                current_col_pixel_height += single_char_height_in_col_with_spacing
-            else:
-                output_segments.append("".join(current_col_chars_list))
-                max_col_height_achieved = max(
-                    max_col_height_achieved, current_col_pixel_height
-                )
-                current_col_chars_list = [char_val]
-                current_col_pixel_height = single_char_height_in_col_with_spacing
-        if current_col_chars_list:
-            output_segments.append("".join(current_col_chars_list))
-            max_col_height_achieved = max(
-                max_col_height_achieved, current_col_pixel_height
-            )
+            for col_start in range(0, len(paragraph), chars_per_col):
+                output_segments.append(paragraph[col_start : col_start + chars_per_col])
+            longest_col_len = max(longest_col_len, min(len(paragraph), chars_per_col))
+        max_col_height_achieved = max(
+            0, longest_col_len * single_char_height_in_col_with_spacing
+        )
         if not output_segments and text:
             output_segments = [text]
             max_col_height_achieved = len(text) * single_char_height_in_col_with_spacing
@@ -1,18 +1,23 @@
 import os
 import math
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor, QFontMetrics, QPen, QBrush
-from PyQt6.QtCore import Qt, QRectF, QPointF
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from types import SimpleNamespace
 from config_manager import ConfigManager
 
 try:
-    from PIL import Image, ImageDraw, ImageFont as PILImageFont
+    from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont as PILImageFont
 
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
     PILImageFont = None
     Image = None
+    ImageChops = None
     ImageDraw = None
+    ImageFilter = None
     print("警告(utils): Pillow 库未安装，图像处理和显示功能将受限。")
 if PILLOW_AVAILABLE:
     from .font_utils import (
@@ -20,41 +25,51 @@ if PILLOW_AVAILABLE:
         get_font_line_height,
         wrap_text_pil,
         find_font_path,
+        _font_char_widths,
+        _font_em_width,
     )
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def _pil_raw_bytes(pil_image: Image.Image) -> bytes:
+    try:
+        pil_image.load()
+        encoder = Image._getencoder(pil_image.mode, "raw", pil_image.mode)
+        encoder.setimage(pil_image.im, (0, 0) + pil_image.size)
+        buffer_size = pil_image.width * pil_image.height * len(pil_image.getbands())
+        _, error_code, data = encoder.encode(max(1, buffer_size))
+        if error_code > 0:
+            return data
+    except Exception:
+        pass
+    return pil_image.tobytes("raw", pil_image.mode)
 
 
-def pil_to_qpixmap(pil_image: Image.Image) -> QPixmap | None:
+def pil_to_qpixmap(pil_image: Image.Image) -> "QPixmap | None":
     if not PILLOW_AVAILABLE or not pil_image:
         return None
+    from PyQt6.QtGui import QPixmap, QImage
+
     try:
-        if pil_image.mode == "P":
-            pil_image = pil_image.convert("RGBA")
-        elif pil_image.mode == "L":
+        if pil_image.mode == "L":
             pil_image = pil_image.convert("RGB")
         elif pil_image.mode not in ("RGB", "RGBA"):
             pil_image = pil_image.convert("RGBA")
-        data = pil_image.tobytes("raw", pil_image.mode)
-        qimage_format = QImage.Format.Format_Invalid
+        data = _pil_raw_bytes(pil_image)
+        bytes_per_line = len(data) // max(1, pil_image.height)
         if pil_image.mode == "RGBA":
             qimage_format = QImage.Format.Format_RGBA8888
-        elif pil_image.mode == "RGB":
+        else:
             qimage_format = QImage.Format.Format_RGB888
-        if qimage_format == QImage.Format.Format_Invalid:
-            print(
-                f"警告(pil_to_qpixmap): 不支持的Pillow图像模式 {pil_image.mode} 转换为QImage。"
-            )
-            pil_image_rgba = pil_image.convert("RGBA")
-            data = pil_image_rgba.tobytes("raw", "RGBA")
-            qimage = QImage(
-                data,
-                pil_image_rgba.width,
-                pil_image_rgba.height,
-                QImage.Format.Format_RGBA8888,
-            )
-            if qimage.isNull():
-                return None
-            return QPixmap.fromImage(qimage)
-        qimage = QImage(data, pil_image.width, pil_image.height, qimage_format)
+        qimage = QImage(
+            data, pil_image.width, pil_image.height, bytes_per_line, qimage_format
+        )
         if qimage.isNull():
             print(
                 f"警告(pil_to_qpixmap): QImage.isNull() 为 True，模式: {pil_image.mode}"
@@ -70,83 +85,70 @@ def crop_image_to_circle(pil_image: Image.Image) -> Image.Image | None:
     if not PILLOW_AVAILABLE or not pil_image:
         return None
     try:
-        img = pil_image.copy().convert("RGBA")
+        img = pil_image if pil_image.mode == "RGBA" else pil_image.convert("RGBA")
         width, height = img.size
         size = min(width, height)
-        mask = Image.new("L", (width, height), 0)
-        draw_mask = ImageDraw.Draw(mask)
         left = (width - size) // 2
         top = (height - size) // 2
+        if NUMPY_AVAILABLE:
+            img_array = np.array(img)
+            radius = size / 2.0
+            yy, xx = np.ogrid[:height, :width]
+            outside = (xx + 0.5 - left - radius) ** 2 + (
+                yy + 0.5 - top - radius
+            ) ** 2 > radius**2
+            img_array[outside, 3] = 0
+            return Image.fromarray(img_array, "RGBA")
+        mask = Image.new("L", (width, height), 0)
+        draw_mask = ImageDraw.Draw(mask)
         right = left + size
         bottom = top + size
         draw_mask.ellipse((left, top, right, bottom), fill=255)
-        output_img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        output_img.paste(img, (0, 0), mask=mask)
-        return output_img
+        mask = ImageChops.multiply(img.getchannel("A"), mask)
+        if img is pil_image:
+            img = img.copy()
+        img.putalpha(mask)
+        return img
     except Exception as e:
         print(f"错误(crop_image_to_circle): {e}")
         return None
 
 
+def _module_available(module_name: str) -> bool:
+    try:
+        return find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def check_dependencies_availability():
-    dependencies = {
+    return {
         "Pillow": PILLOW_AVAILABLE,
-        "google.generativeai": False,
-        "google-cloud-vision_lib_present": False,
-        "openai_lib": False,
+        "google.generativeai": _module_available("google.generativeai"),
+        "google-cloud-vision_lib_present": _module_available("google.cloud.vision"),
+        "openai_lib": _module_available("openai"),
     }
-    try:
-        import google.generativeai
 
-        dependencies["google.generativeai"] = True
-    except ImportError:
-        pass
-    try:
-        import google.cloud.vision
-
-        dependencies["google-cloud-vision_lib_present"] = True
-    except ImportError:
-        pass
-    try:
-        import openai
 
-        dependencies["openai_lib"] = True
-    except ImportError:
-        pass
-    return dependencies
+_SENTENCE_END_CHARS = frozenset("。、！？.!?")
+_CLOSING_BRACKETS = frozenset("」』）)】]\"'")
+_NO_SPACE_JOIN_LANGS = frozenset(
+    ("ja", "zh", "ko", "jpn", "chi_sim", "kor", "chinese_sim")
+)
+_NO_SPACE_AFTER_CHARS = frozenset("-=#")
+_NO_SPACE_BEFORE_CHARS = frozenset(".,!?:;")
 
 
 def is_sentence_end(text: str) -> bool:
-    text = text.strip()
+    text = text.rstrip()
     if not text:
         return False
-    end_chars = ("。", "、", "！", "？", ".", "!", "?")
-    closing_brackets = ("」", "』", "）", ")", "】", "]", '"', "'")
-    last_char = ""
-    for char_val in reversed(text):
-        if not char_val.isspace():
-            last_char = char_val
-            break
-    if not last_char:
-        return False
-    if last_char in end_chars:
+    last_char = text[-1]
+    if last_char in _SENTENCE_END_CHARS:
         return True
-    if last_char in closing_brackets:
-        if len(text) > 1:
-            temp_text = text
-            while temp_text.endswith(last_char) or temp_text.endswith(" "):
-                if temp_text.endswith(last_char):
-                    temp_text = temp_text[: -len(last_char)]
-                else:
-                    temp_text = temp_text[:-1]
-            second_last_char = ""
-            if temp_text:
-                for char_val_inner in reversed(temp_text):
-                    if not char_val_inner.isspace():
-                        second_last_char = char_val_inner
-                        break
-                if second_last_char in end_chars:
-                    return True
+    if last_char in _CLOSING_BRACKETS:
+        core = text.rstrip(last_char + " ").rstrip()
+        return bool(core) and core[-1] in _SENTENCE_END_CHARS
     return False
 
 
@@ -165,38 +167,86 @@ def check_horizontal_proximity(
         return False
     b1_x0, b1_y0, b1_x1, b1_y1 = box1
     b2_x0, b2_y0, b2_x1, b2_y1 = box2
-    if b1_x0 > b2_x0 and b1_x1 > b2_x1 and b1_x0 > b2_x1:
-        return False
     h1 = b1_y1 - b1_y0
     h2 = b2_y1 - b2_y0
     if h1 <= 0 or h2 <= 0:
         return False
-    center1_y = (b1_y0 + b1_y1) / 2
-    center2_y = (b2_y0 + b2_y1) / 2
     avg_h = (h1 + h2) / 2
-    if avg_h <= 0:
-        return False
-    vertical_diff = abs(center1_y - center2_y)
+    vertical_diff = abs((b1_y0 + b1_y1) / 2 - (b2_y0 + b2_y1) / 2)
     if vertical_diff > avg_h * max_vertical_diff_ratio:
         return False
     if b1_x1 <= b2_x0:
-        horizontal_gap = b2_x0 - b1_x1
-        if horizontal_gap > avg_h * max_horizontal_gap_ratio:
-            return False
-    else:
-        if b2_x0 < b1_x0:
-            overlap = min(b1_x1, b2_x1) - max(b1_x0, b2_x0)
-            if overlap < avg_h * min_overlap_ratio:
-                pass
-        if b2_x0 < b1_x0 and (b1_x0 - b2_x0 > avg_h * 0.5):
-            return False
+        return b2_x0 - b1_x1 <= avg_h * max_horizontal_gap_ratio
+    if b2_x0 < b1_x0 and (b1_x0 - b2_x0 > avg_h * 0.5):
+        return False
+    if b1_x0 > b2_x0 and b1_x1 > b2_x1 and b1_x0 > b2_x1:
+        return False
+    return True
+
+
+def _check_horizontal_proximity_fast(
+    box1: tuple,
+    box2: tuple,
+    max_vertical_diff_ratio: float = 0.6,
+    max_horizontal_gap_ratio: float = 1.5,
+) -> bool:
+    b1_x0, b1_y0, b1_x1, b1_y1 = box1
+    b2_x0, b2_y0, b2_x1, b2_y1 = box2
+    heights_sum = b1_y1 - b1_y0 + b2_y1 - b2_y0
+    if abs(b1_y0 + b1_y1 - b2_y0 - b2_y1) > heights_sum * max_vertical_diff_ratio:
+        return False
+    if b1_x1 <= b2_x0:
+        return 2 * (b2_x0 - b1_x1) <= heights_sum * max_horizontal_gap_ratio
+    if b2_x0 < b1_x0:
+        return b1_x0 <= b2_x1 and 2 * (b1_x0 - b2_x0) <= heights_sum * 0.5
     return True
 
 
+def _horizontal_proximity_links(
+    bboxes: "np.ndarray",
+    max_vertical_diff_ratio: float = 0.6,
+    max_horizontal_gap_ratio: float = 1.5,
+) -> "np.ndarray":
+    b1_x0, b1_y0, b1_x1, b1_y1 = bboxes[:-1].T
+    b2_x0, b2_y0, b2_x1, b2_y1 = bboxes[1:].T
+    heights_sum = b1_y1 - b1_y0 + b2_y1 - b2_y0
+    aligned = (
+        np.abs(b1_y0 + b1_y1 - b2_y0 - b2_y1) <= heights_sum * max_vertical_diff_ratio
+    )
+    gap_ok = 2 * (b2_x0 - b1_x1) <= heights_sum * max_horizontal_gap_ratio
+    backtrack_ok = (b2_x0 >= b1_x0) | (
+        (b1_x0 <= b2_x1) & (2 * (b1_x0 - b2_x0) <= heights_sum * 0.5)
+    )
+    return aligned & np.where(b1_x1 <= b2_x0, gap_ok, backtrack_ok)
+
+
+def _flatten_ocr_box(box_info_raw) -> list[float] | None:
+    if not isinstance(box_info_raw, list):
+        return None
+    if len(box_info_raw) == 4:
+        if not all(isinstance(p, (list, tuple)) and len(p) == 2 for p in box_info_raw):
+            return None
+        box_coords = [c for p in box_info_raw for c in p]
+    elif len(box_info_raw) == 8:
+        box_coords = box_info_raw
+    else:
+        return None
+    try:
+        box_coords = [float(c) for c in box_coords]
+    except (ValueError, TypeError):
+        return None
+    if not all(math.isfinite(c) for c in box_coords):
+        return None
+    return box_coords
+
+
 def process_ocr_results_merge_lines(ocr_output_raw_segments: list, lang_hint="ja"):
     if not ocr_output_raw_segments or not isinstance(ocr_output_raw_segments, list):
         return []
     raw_blocks = []
+    parsed_ids = []
+    parsed_texts = []
+    parsed_boxes = []
     try:
         for i, item_data in enumerate(ocr_output_raw_segments):
             if not isinstance(item_data, (list, tuple)) or len(item_data) != 2:
@@ -222,61 +272,53 @@ def process_ocr_results_merge_lines(ocr_output_raw_segments: list, lang_hint="ja
                 continue
             if not text_content_str:
                 continue
-            vertices_parsed = []
-            if isinstance(box_info_raw, list) and len(box_info_raw) == 4:
-                valid_points = True
-                for p_idx, p in enumerate(box_info_raw):
-                    if isinstance(p, (list, tuple)) and len(p) == 2:
-                        try:
-                            vertices_parsed.append(
-                                (int(round(float(p[0]))), int(round(float(p[1]))))
-                            )
-                        except (ValueError, TypeError):
-                            valid_points = False
-                            break
-                    else:
-                        valid_points = False
-                        break
-                if not valid_points:
-                    vertices_parsed = []
-            elif isinstance(box_info_raw, list) and len(box_info_raw) == 8:
-                try:
-                    temp_v = []
-                    for k_coord in range(0, 8, 2):
-                        temp_v.append(
-                            (
-                                int(round(float(box_info_raw[k_coord]))),
-                                int(round(float(box_info_raw[k_coord + 1]))),
-                            )
-                        )
-                    if len(temp_v) == 4:
-                        vertices_parsed = temp_v
-                    else:
-                        vertices_parsed = []
-                except (ValueError, TypeError):
-                    vertices_parsed = []
-            else:
-                vertices_parsed = []
-            if not vertices_parsed:
-                continue
-            x_coords_list = [v[0] for v in vertices_parsed]
-            y_coords_list = [v[1] for v in vertices_parsed]
-            bbox_rect = [
-                min(x_coords_list),
-                min(y_coords_list),
-                max(x_coords_list),
-                max(y_coords_list),
-            ]
-            if not (bbox_rect[2] > bbox_rect[0] and bbox_rect[3] > bbox_rect[1]):
+            box_coords = _flatten_ocr_box(box_info_raw)
+            if box_coords is None:
                 continue
-            raw_blocks.append(
-                {
-                    "id": i,
-                    "text": text_content_str,
-                    "bbox": bbox_rect,
-                    "vertices": vertices_parsed,
-                }
+            parsed_ids.append(i)
+            parsed_texts.append(text_content_str)
+            parsed_boxes.append(box_coords)
+        if parsed_boxes and NUMPY_AVAILABLE:
+            box_points = np.asarray(parsed_boxes, dtype=np.float64).reshape(-1, 4, 2)
+            box_points = np.rint(box_points).astype(np.int64)
+            box_mins = box_points.min(axis=1)
+            box_maxs = box_points.max(axis=1)
+            valid_mask = (box_maxs[:, 0] > box_mins[:, 0]) & (
+                box_maxs[:, 1] > box_mins[:, 1]
             )
+            for k in np.flatnonzero(valid_mask).tolist():
+                raw_blocks.append(
+                    {
+                        "id": parsed_ids[k],
+                        "text": parsed_texts[k],
+                        "bbox": tuple(box_mins[k].tolist() + box_maxs[k].tolist()),
+                        "vertices": [tuple(v) for v in box_points[k].tolist()],
+                    }
+                )
+        else:
+            for item_id, text_content_str, box_coords in zip(
+                parsed_ids, parsed_texts, parsed_boxes
+            ):
+                x0, y0, x1, y1, x2, y2, x3, y3 = (
+                    int(round(coord)) for coord in box_coords
+                )
+                vertices_parsed = [(x0, y0), (x1, y1), (x2, y2), (x3, y3)]
+                bbox_rect = (
+                    min(x0, x1, x2, x3),
+                    min(y0, y1, y2, y3),
+                    max(x0, x1, x2, x3),
+                    max(y0, y1, y2, y3),
+                )
+                if not (bbox_rect[2] > bbox_rect[0] and bbox_rect[3] > bbox_rect[1]):
+                    continue
+                raw_blocks.append(
+                    {
+                        "id": item_id,
+                        "text": text_content_str,
+                        "bbox": bbox_rect,
+                        "vertices": vertices_parsed,
+                    }
+                )
     except Exception as e:
         print(f"错误(process_ocr_results_merge_lines) - initial parsing: {e}")
         return []
@@ -284,63 +326,143 @@ def process_ocr_results_merge_lines(ocr_output_raw_segments: list, lang_hint="ja
         return []
     raw_blocks.sort(key=lambda b: (b["bbox"][1], b["bbox"][0]))
     merged_results = []
-    processed_block_ids = set()
-    for i in range(len(raw_blocks)):
-        if raw_blocks[i]["id"] in processed_block_ids:
-            continue
+    num_blocks = len(raw_blocks)
+    joins_with_space = lang_hint not in _NO_SPACE_JOIN_LANGS
+    sorted_bboxes = [b["bbox"] for b in raw_blocks]
+    if NUMPY_AVAILABLE and num_blocks > 1:
+        links_to_next = _horizontal_proximity_links(
+            np.asarray(sorted_bboxes, dtype=np.float64)
+        ).tolist()
+    else:
+        links_to_next = [
+            _check_horizontal_proximity_fast(sorted_bboxes[k], sorted_bboxes[k + 1])
+            for k in range(num_blocks - 1)
+        ]
+    i = 0
+    while i < num_blocks:
         current_block_data = raw_blocks[i]
-        current_text_line = current_block_data["text"]
-        current_line_vertices_representation = list(current_block_data["vertices"])
-        current_line_bbox = list(current_block_data["bbox"])
-        last_merged_block_in_this_line = current_block_data
-        processed_block_ids.add(current_block_data["id"])
-        for j in range(i + 1, len(raw_blocks)):
+        current_line_parts = [current_block_data["text"]]
+        line_ends_sentence = is_sentence_end(current_block_data["text"])
+        j = i + 1
+        while j < num_blocks:
+            if line_ends_sentence or not links_to_next[j - 1]:
+                break
             next_block_candidate_data = raw_blocks[j]
-            if next_block_candidate_data["id"] in processed_block_ids:
-                continue
-            should_merge_flag = False
-            if not is_sentence_end(current_text_line):
-                if check_horizontal_proximity(
-                    last_merged_block_in_this_line, next_block_candidate_data
-                ):
-                    should_merge_flag = True
-            if should_merge_flag:
-                joiner = ""
-                if lang_hint not in [
-                    "ja",
-                    "zh",
-                    "ko",
-                    "jpn",
-                    "chi_sim",
-                    "kor",
-                    "chinese_sim",
-                ]:
-                    if current_text_line and next_block_candidate_data["text"]:
-                        if not current_text_line.endswith(
-                            ("-", "=", "#")
-                        ) and not next_block_candidate_data["text"][0] in (
-                            ".",
-                            ",",
-                            "!",
-                            "?",
-                            ":",
-                            ";",
-                        ):
-                            joiner = " "
-                current_text_line += joiner + next_block_candidate_data["text"]
-                next_bbox = next_block_candidate_data["bbox"]
-                current_line_bbox[0] = min(current_line_bbox[0], next_bbox[0])
-                current_line_bbox[1] = min(current_line_bbox[1], next_bbox[1])
-                current_line_bbox[2] = max(current_line_bbox[2], next_bbox[2])
-                current_line_bbox[3] = max(current_line_bbox[3], next_bbox[3])
-                last_merged_block_in_this_line = next_block_candidate_data
-                processed_block_ids.add(next_block_candidate_data["id"])
+            next_text = next_block_candidate_data["text"]
+            if (
+                joins_with_space
+                and current_line_parts[-1][-1] not in _NO_SPACE_AFTER_CHARS
+                and next_text[0] not in _NO_SPACE_BEFORE_CHARS
+            ):
+                current_line_parts.append(" ")
+            current_line_parts.append(next_text)
+            if next_text[-1] in _CLOSING_BRACKETS and not next_text.rstrip(
+                next_text[-1] + " "
+            ):
+                line_ends_sentence = is_sentence_end("".join(current_line_parts))
             else:
-                break
-        merged_results.append((current_text_line, current_line_vertices_representation))
+                line_ends_sentence = is_sentence_end(next_text)
+            j += 1
+        merged_results.append(
+            ("".join(current_line_parts), current_block_data["vertices"])
+        )
+        i = j
     return merged_results
 
 
+@lru_cache(maxsize=4096)
+def _glyph_mask(
+    pil_font: PILImageFont.FreeTypeFont, char: str, stroke_width: int
+) -> tuple[Image.Image, int, int]:
+    left, top, right, bottom = pil_font.getbbox(char, stroke_width=stroke_width)
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text(
+        (-left, -top),
+        char,
+        font=pil_font,
+        fill=255,
+        stroke_width=stroke_width,
+        stroke_fill=255,
+    )
+    return mask, left, top
+
+
+def _glyph_origin(position: tuple[float, float]) -> tuple[int, int]:
+    x_whole, y_whole = int(position[0]), int(position[1])
+    x_sub = math.floor((position[0] - x_whole) * 64 + 0.5)
+    y_sub = math.floor((position[1] - y_whole) * 64 + 0.5)
+    return x_whole + ((x_sub + 32) >> 6), y_whole + ((y_sub + 31) >> 6)
+
+
+def _paste_glyph(
+    surface: Image.Image,
+    pil_font: PILImageFont.FreeTypeFont,
+    char: str,
+    position: tuple[float, float],
+    fill_color: tuple,
+    stroke_width: int = 0,
+    stroke_color: tuple | None = None,
+) -> None:
+    x, y = _glyph_origin(position)
+    if stroke_width > 0:
+        mask, left, top = _glyph_mask(pil_font, char, stroke_width)
+        surface.paste(
+            stroke_color,
+            (x + left, y + top, x + left + mask.width, y + top + mask.height),
+            mask,
+        )
+        if stroke_color == fill_color:
+            return
+    mask, left, top = _glyph_mask(pil_font, char, 0)
+    surface.paste(
+        fill_color,
+        (x + left, y + top, x + left + mask.width, y + top + mask.height),
+        mask,
+    )
+
+
+_metric_draw = None
+
+
+def _get_metric_draw() -> ImageDraw.ImageDraw:
+    global _metric_draw
+    if _metric_draw is None:
+        _metric_draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    return _metric_draw
+
+
+@lru_cache(maxsize=1024)
+def _wrap_text_cached(
+    text: str,
+    pil_font: PILImageFont.FreeTypeFont | PILImageFont.ImageFont,
+    max_dim: int,
+    orientation: str,
+    char_spacing_px: int,
+    line_or_col_spacing_px: int,
+) -> tuple[tuple[str, ...], int, int, int]:
+    segments, total_dim_primary, segment_dim_secondary, max_dim_achieved = (
+        wrap_text_pil(
+            _get_metric_draw(),
+            text,
+            pil_font,
+            max_dim=max_dim,
+            orientation=orientation,
+            char_spacing_px=char_spacing_px,
+            line_or_col_spacing_px=line_or_col_spacing_px,
+        )
+    )
+    return tuple(segments), total_dim_primary, segment_dim_secondary, max_dim_achieved
+
+
+_LINE_ALIGN_FACTORS = {"center": 0.5, "right": 1.0}
+
+
+def _new_block_surface(width: int, height: int, bg_color_pil: tuple) -> Image.Image:
+    if bg_color_pil and len(bg_color_pil) == 4 and bg_color_pil[3] > 0:
+        return Image.new("RGBA", (width, height), tuple(bg_color_pil))
+    return Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+
 def _render_single_block_pil_for_preview(
     block: "ProcessedBlock",
     font_name_config: str,
@@ -361,24 +483,6 @@ def _render_single_block_pil_for_preview(
         or not block.translated_text
         or not block.translated_text.strip()
     ):
-        if PILLOW_AVAILABLE and block.bbox:
-            bbox_width = int(block.bbox[2] - block.bbox[0])
-            bbox_height = int(block.bbox[3] - block.bbox[1])
-            if bbox_width > 0 and bbox_height > 0:
-                empty_surface = Image.new(
-                    "RGBA", (bbox_width, bbox_height), (0, 0, 0, 0)
-                )
-                if (
-                    text_bg_color_pil
-                    and len(text_bg_color_pil) == 4
-                    and text_bg_color_pil[3] > 0
-                ):
-                    draw = ImageDraw.Draw(empty_surface)
-                    draw.rectangle(
-                        [(0, 0), (bbox_width - 1, bbox_height - 1)],
-                        fill=text_bg_color_pil,
-                    )
-                return empty_surface
         return None
     font_size_to_use = int(block.font_size_pixels)
     pil_font = get_pil_font(font_name_config, font_size_to_use)
@@ -399,8 +503,24 @@ def _render_single_block_pil_for_preview(
         )
         return err_img
     text_to_draw = block.translated_text
-    dummy_metric_img = Image.new("RGBA", (1, 1))
-    pil_draw_metric = ImageDraw.Draw(dummy_metric_img)
+    pil_draw_metric = _get_metric_draw()
+    if hasattr(pil_font, "getlength"):
+        measure_text = pil_font.getlength
+        char_w_cache = _font_char_widths(pil_font)
+    else:
+
+        def measure_text(text: str) -> float:
+            return pil_draw_metric.textlength(text, font=pil_font)
+
+        char_w_cache: dict[str, float] = {}
+
+    def _char_width(char: str) -> float:
+        char_w = char_w_cache.get(char)
+        if char_w is None:
+            char_w = measure_text(char)
+            char_w_cache[char] = char_w
+        return char_w
+
     target_surface_width = int(block.bbox[2] - block.bbox[0])
     target_surface_height = int(block.bbox[3] - block.bbox[1])
     if target_surface_width <= 0 or target_surface_height <= 0:
@@ -417,7 +537,7 @@ def _render_single_block_pil_for_preview(
         return err_img_bbox
     max_content_width_for_wrapping = max(1, target_surface_width - (2 * text_padding))
     max_content_height_for_wrapping = max(1, target_surface_height - (2 * text_padding))
-    wrapped_segments: list[str]
+    wrapped_segments: tuple[str, ...]
     actual_text_render_width_unpadded: int
     actual_text_render_height_unpadded: int
     seg_secondary_dim_with_spacing: int
@@ -427,14 +547,13 @@ def _render_single_block_pil_for_preview(
             actual_text_render_height_unpadded,
             seg_secondary_dim_with_spacing,
             actual_text_render_width_unpadded,
-        ) = wrap_text_pil(
-            pil_draw_metric,
+        ) = _wrap_text_cached(
             text_to_draw,
             pil_font,
-            max_dim=int(max_content_width_for_wrapping),
-            orientation="horizontal",
-            char_spacing_px=h_char_spacing_px,
-            line_or_col_spacing_px=h_line_spacing_px,
+            int(max_content_width_for_wrapping),
+            "horizontal",
+            h_char_spacing_px,
+            h_line_spacing_px,
         )
     else:
         (
@@ -442,34 +561,28 @@ def _render_single_block_pil_for_preview(
             actual_text_render_width_unpadded,
             seg_secondary_dim_with_spacing,
             actual_text_render_height_unpadded,
-        ) = wrap_text_pil(
-            pil_draw_metric,
+        ) = _wrap_text_cached(
             text_to_draw,
             pil_font,
-            max_dim=int(max_content_height_for_wrapping),
-            orientation="vertical",
-            char_spacing_px=v_char_spacing_px,
-            line_or_col_spacing_px=v_col_spacing_px,
+            int(max_content_height_for_wrapping),
+            "vertical",
+            v_char_spacing_px,
+            v_col_spacing_px,
         )
     if not wrapped_segments and text_to_draw:
-        wrapped_segments = [text_to_draw]
+        wrapped_segments = (text_to_draw,)
         if block.orientation == "horizontal":
-            actual_text_render_width_unpadded = pil_draw_metric.textlength(
-                text_to_draw, font=pil_font
-            ) + (
-                h_char_spacing_px * (len(text_to_draw) - 1)
-                if len(text_to_draw) > 1
-                else 0
-            )
+            actual_text_render_width_unpadded = measure_text(
+                text_to_draw
+            ) + h_char_spacing_px * max(0, len(text_to_draw) - 1)
             seg_secondary_dim_with_spacing = get_font_line_height(
                 pil_font, font_size_to_use, h_line_spacing_px
             )
             actual_text_render_height_unpadded = seg_secondary_dim_with_spacing
         else:
-            try:
-                actual_text_render_width_unpadded = pil_font.getlength("M")
-            except:
-                actual_text_render_width_unpadded = font_size_to_use
+            actual_text_render_width_unpadded = _font_em_width(
+                pil_font, font_size_to_use
+            )
             seg_secondary_dim_with_spacing = get_font_line_height(
                 pil_font, font_size_to_use, v_char_spacing_px
             )
@@ -488,28 +601,23 @@ def _render_single_block_pil_for_preview(
             print(
                 f"警告(_render_single_block_pil_for_preview): 文本 '{text_to_draw[:20]}...' 的计算渲染尺寸为零或负。"
             )
-        empty_surface_fallback = Image.new(
-            "RGBA", (target_surface_width, target_surface_height), (0, 0, 0, 0)
+        return _new_block_surface(
+            target_surface_width, target_surface_height, text_bg_color_pil
         )
-        if (
-            text_bg_color_pil
-            and len(text_bg_color_pil) == 4
-            and text_bg_color_pil[3] > 0
-        ):
-            ImageDraw.Draw(empty_surface_fallback).rectangle(
-                [(0, 0), (target_surface_width - 1, target_surface_height - 1)],
-                fill=text_bg_color_pil,
-            )
-        return empty_surface_fallback
-    block_surface = Image.new(
-        "RGBA", (target_surface_width, target_surface_height), (0, 0, 0, 0)
+    block_surface = _new_block_surface(
+        target_surface_width, target_surface_height, text_bg_color_pil
+    )
+    text_layer = Image.new("L", block_surface.size, 0)
+    draw_on_text_layer = ImageDraw.Draw(text_layer)
+    use_glyph_masks = isinstance(pil_font, PILImageFont.FreeTypeFont)
+    stroke_px = (
+        outline_thickness
+        if outline_thickness > 0
+        and text_outline_color_pil
+        and len(text_outline_color_pil) == 4
+        and text_outline_color_pil[3] > 0
+        else 0
     )
-    draw_on_block_surface = ImageDraw.Draw(block_surface)
-    if text_bg_color_pil and len(text_bg_color_pil) == 4 and text_bg_color_pil[3] > 0:
-        draw_on_block_surface.rectangle(
-            [(0, 0), (target_surface_width - 1, target_surface_height - 1)],
-            fill=text_bg_color_pil,
-        )
     content_area_x_start = text_padding
     content_area_y_start = text_padding
     text_block_overall_start_x = content_area_x_start
@@ -542,93 +650,53 @@ def _render_single_block_pil_for_preview(
             )
     if block.orientation == "horizontal":
         current_y_pil = text_block_overall_start_y
+        line_align_factor = _LINE_ALIGN_FACTORS.get(block.text_align)
         for line_idx, line_text in enumerate(wrapped_segments):
             is_manual_break_line = line_text == ""
             if not is_manual_break_line:
-                line_w_specific_pil = pil_draw_metric.textlength(
-                    line_text, font=pil_font
-                )
-                if len(line_text) > 1 and h_char_spacing_px != 0:
-                    line_w_specific_pil += h_char_spacing_px * (len(line_text) - 1)
                 line_draw_x_pil = text_block_overall_start_x
-                if block.text_align == "center":
-                    line_draw_x_pil = (
-                        text_block_overall_start_x
-                        + (actual_text_render_width_unpadded - line_w_specific_pil)
-                        / 2.0
-                    )
-                elif block.text_align == "right":
-                    line_draw_x_pil = text_block_overall_start_x + (
+                if line_align_factor is not None:
+                    if h_char_spacing_px != 0:
+                        line_w_specific_pil = sum(
+                            _char_width(c) for c in line_text
+                        ) + h_char_spacing_px * (len(line_text) - 1)
+                    else:
+                        line_w_specific_pil = measure_text(line_text)
+                    line_draw_x_pil += (
                         actual_text_render_width_unpadded - line_w_specific_pil
-                    )
-                if (
-                    outline_thickness > 0
-                    and text_outline_color_pil
-                    and len(text_outline_color_pil) == 4
-                    and text_outline_color_pil[3] > 0
-                ):
-                    for dx_o in range(-outline_thickness, outline_thickness + 1):
-                        for dy_o in range(-outline_thickness, outline_thickness + 1):
-                            if dx_o == 0 and dy_o == 0:
-                                continue
-                            if h_char_spacing_px != 0:
-                                temp_x_char_outline = line_draw_x_pil + dx_o
-                                for char_ol in line_text:
-                                    draw_on_block_surface.text(
-                                        (temp_x_char_outline, current_y_pil + dy_o),
-                                        char_ol,
-                                        font=pil_font,
-                                        fill=text_outline_color_pil,
-                                    )
-                                    temp_x_char_outline += (
-                                        pil_draw_metric.textlength(
-                                            char_ol, font=pil_font
-                                        )
-                                        + h_char_spacing_px
-                                    )
-                            else:
-                                draw_on_block_surface.text(
-                                    (line_draw_x_pil + dx_o, current_y_pil + dy_o),
-                                    line_text,
-                                    font=pil_font,
-                                    fill=text_outline_color_pil,
-                                    spacing=0,
-                                )
+                    ) * line_align_factor
                 if h_char_spacing_px != 0:
                     temp_x_char_main = line_draw_x_pil
                     for char_m in line_text:
-                        draw_on_block_surface.text(
-                            (temp_x_char_main, current_y_pil),
-                            char_m,
-                            font=pil_font,
-                            fill=text_main_color_pil,
-                        )
-                        temp_x_char_main += (
-                            pil_draw_metric.textlength(char_m, font=pil_font)
-                            + h_char_spacing_px
-                        )
+                        if use_glyph_masks:
+                            _paste_glyph(
+                                text_layer,
+                                pil_font,
+                                char_m,
+                                (temp_x_char_main, current_y_pil),
+                                255,
+                            )
+                        else:
+                            draw_on_text_layer.text(
+                                (temp_x_char_main, current_y_pil),
+                                char_m,
+                                font=pil_font,
+                                fill=255,
+                            )
+                        temp_x_char_main += _char_width(char_m) + h_char_spacing_px
                 else:
-                    draw_on_block_surface.text(
+                    draw_on_text_layer.text(
                         (line_draw_x_pil, current_y_pil),
                         line_text,
                         font=pil_font,
-                        fill=text_main_color_pil,
+                        fill=255,
                         spacing=0,
                     )
             current_y_pil += seg_secondary_dim_with_spacing
             if is_manual_break_line:
                 current_y_pil += h_manual_break_extra_px
     else:
-        try:
-            single_col_visual_width_metric = pil_font.getlength("M")
-            if single_col_visual_width_metric == 0:
-                single_col_visual_width_metric = (
-                    pil_font.size if hasattr(pil_font, "size") else font_size_to_use
-                )
-        except AttributeError:
-            single_col_visual_width_metric = (
-                pil_font.size if hasattr(pil_font, "size") else font_size_to_use
-            )
+        single_col_visual_width_metric = _font_em_width(pil_font, font_size_to_use)
         current_x_pil_col_draw_start = 0.0
         if block.orientation == "vertical_rtl":
             current_x_pil_col_draw_start = (
@@ -639,61 +707,163 @@ def _render_single_block_pil_for_preview(
         else:
             current_x_pil_col_draw_start = text_block_overall_start_x
         current_y_pil_char_start = text_block_overall_start_y
+        column_step = single_col_visual_width_metric + v_col_spacing_px
+        column_direction = -1 if block.orientation == "vertical_rtl" else 1
+        last_col_idx = len(wrapped_segments) - 1
         for col_idx, col_text in enumerate(wrapped_segments):
             is_manual_break_col = col_text == ""
             current_y_pil_char = current_y_pil_char_start
             if not is_manual_break_col:
                 for char_in_col_idx, char_in_col in enumerate(col_text):
-                    char_w_specific_pil = pil_draw_metric.textlength(
-                        char_in_col, font=pil_font
-                    )
+                    char_w_specific_pil = _char_width(char_in_col)
                     char_x_offset_in_col_slot = (
                         single_col_visual_width_metric - char_w_specific_pil
                     ) / 2.0
                     final_char_draw_x = (
                         current_x_pil_col_draw_start + char_x_offset_in_col_slot
                     )
-                    if (
-                        outline_thickness > 0
-                        and text_outline_color_pil
-                        and len(text_outline_color_pil) == 4
-                        and text_outline_color_pil[3] > 0
-                    ):
-                        for dx_o in range(-outline_thickness, outline_thickness + 1):
-                            for dy_o in range(
-                                -outline_thickness, outline_thickness + 1
-                            ):
-                                if dx_o == 0 and dy_o == 0:
-                                    continue
-                                draw_on_block_surface.text(
-                                    (
-                                        final_char_draw_x + dx_o,
-                                        current_y_pil_char + dy_o,
-                                    ),
-                                    char_in_col,
-                                    font=pil_font,
-                                    fill=text_outline_color_pil,
-                                )
-                    draw_on_block_surface.text(
-                        (final_char_draw_x, current_y_pil_char),
-                        char_in_col,
-                        font=pil_font,
-                        fill=text_main_color_pil,
-                    )
+                    if use_glyph_masks:
+                        _paste_glyph(
+                            text_layer,
+                            pil_font,
+                            char_in_col,
+                            (final_char_draw_x, current_y_pil_char),
+                            255,
+                        )
+                    else:
+                        draw_on_text_layer.text(
+                            (final_char_draw_x, current_y_pil_char),
+                            char_in_col,
+                            font=pil_font,
+                            fill=255,
+                        )
                     current_y_pil_char += seg_secondary_dim_with_spacing
-            if col_idx < len(wrapped_segments) - 1:
-                spacing_for_next_column = (
-                    single_col_visual_width_metric + v_col_spacing_px
-                )
+            if col_idx < last_col_idx:
+                spacing_for_next_column = column_step
                 if is_manual_break_col:
                     spacing_for_next_column += v_manual_break_extra_px
-                if block.orientation == "vertical_rtl":
-                    current_x_pil_col_draw_start -= spacing_for_next_column
-                else:
-                    current_x_pil_col_draw_start += spacing_for_next_column
+                current_x_pil_col_draw_start += (
+                    column_direction * spacing_for_next_column
+                )
+    surface_box = (0, 0) + block_surface.size
+    if stroke_px > 0:
+        outline_mask = text_layer
+        for _ in range(stroke_px):
+            outline_mask = outline_mask.filter(ImageFilter.MaxFilter(3))
+        block_surface.paste(text_outline_color_pil, surface_box, outline_mask)
+    block_surface.paste(text_main_color_pil, surface_box, text_layer)
     return block_surface
 
 
+def _render_block_surface(
+    translated_text: str,
+    surface_size: tuple,
+    orientation: str,
+    text_align: str,
+    font_size_pixels: int,
+    font_name_config: str,
+    text_main_color_pil: tuple,
+    text_outline_color_pil: tuple,
+    text_bg_color_pil: tuple,
+    outline_thickness: int,
+    text_padding: int,
+    h_char_spacing_px: int,
+    h_line_spacing_px: int,
+    v_char_spacing_px: int,
+    v_col_spacing_px: int,
+    h_manual_break_extra_px: int,
+    v_manual_break_extra_px: int,
+) -> Image.Image | None:
+    block_stub = SimpleNamespace(
+        translated_text=translated_text,
+        bbox=(0, 0) + surface_size,
+        orientation=orientation,
+        text_align=text_align,
+        font_size_pixels=font_size_pixels,
+    )
+    return _render_single_block_pil_for_preview(
+        block=block_stub,
+        font_name_config=font_name_config,
+        text_main_color_pil=text_main_color_pil,
+        text_outline_color_pil=text_outline_color_pil,
+        text_bg_color_pil=text_bg_color_pil,
+        outline_thickness=outline_thickness,
+        text_padding=text_padding,
+        h_char_spacing_px=h_char_spacing_px,
+        h_line_spacing_px=h_line_spacing_px,
+        v_char_spacing_px=v_char_spacing_px,
+        v_col_spacing_px=v_col_spacing_px,
+        h_manual_break_extra_px=h_manual_break_extra_px,
+        v_manual_break_extra_px=v_manual_break_extra_px,
+    )
+
+
+_BLOCK_SURFACE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_block_surface_cache: dict[tuple, Image.Image | None] = {}
+_block_surface_cache_bytes = 0
+_block_surface_cache_lock = threading.Lock()
+
+
+def _surface_nbytes(surface: Image.Image | None) -> int:
+    if surface is None:
+        return 0
+    return surface.width * surface.height * len(surface.getbands())
+
+
+def _render_block_surface_cached(*render_args) -> Image.Image | None:
+    global _block_surface_cache_bytes
+    with _block_surface_cache_lock:
+        if render_args in _block_surface_cache:
+            surface = _block_surface_cache.pop(render_args)
+            _block_surface_cache[render_args] = surface
+            return surface
+    surface = _render_block_surface(*render_args)
+    surface_bytes = _surface_nbytes(surface)
+    if surface_bytes > _BLOCK_SURFACE_CACHE_MAX_BYTES:
+        return surface
+    with _block_surface_cache_lock:
+        if render_args not in _block_surface_cache:
+            _block_surface_cache[render_args] = surface
+            _block_surface_cache_bytes += surface_bytes
+            while _block_surface_cache_bytes > _BLOCK_SURFACE_CACHE_MAX_BYTES:
+                oldest_key = next(iter(_block_surface_cache))
+                _block_surface_cache_bytes -= _surface_nbytes(
+                    _block_surface_cache.pop(oldest_key)
+                )
+    return surface
+
+
+def _composite_block_surface(
+    target_image: Image.Image, surface: Image.Image, position: tuple[int, int]
+) -> None:
+    if surface.mode != "RGBA":
+        target_image.paste(surface, position)
+    elif surface.getpixel((0, 0))[3] == 255 and surface.getextrema()[3][0] == 255:
+        target_image.paste(surface, position)
+    else:
+        target_image.alpha_composite(surface, position)
+
+
+def _place_block_layer(
+    surface: Image.Image, angle: float, bbox
+) -> tuple[Image.Image, int, int]:
+    if angle != 0:
+        try:
+            surface = surface.rotate(
+                -angle,
+                expand=True,
+                resample=Image.Resampling.BILINEAR,
+                fillcolor=(0, 0, 0, 0),
+            )
+        except Exception as e:
+            print(f"Error rotating block content: {e}")
+    center_x = (bbox[0] + bbox[2]) / 2.0
+    center_y = (bbox[1] + bbox[3]) / 2.0
+    paste_x = int(round(center_x - (surface.width / 2.0)))
+    paste_y = int(round(center_y - (surface.height / 2.0)))
+    return surface, paste_x, paste_y
+
+
 def _draw_single_block_pil(
     draw_target_image: Image.Image,
     block: "ProcessedBlock",
@@ -733,33 +903,17 @@ def _draw_single_block_pil(
     )
     if not rendered_block_content_pil:
         return
-    final_surface_to_paste = rendered_block_content_pil
-    if block.angle != 0:
-        try:
-            final_surface_to_paste = rendered_block_content_pil.rotate(
-                -block.angle, expand=True, resample=Image.Resampling.BICUBIC
-            )
-        except Exception as e:
-            print(f"Error rotating block content: {e}")
-    block_center_x_orig_coords = (block.bbox[0] + block.bbox[2]) / 2.0
-    block_center_y_orig_coords = (block.bbox[1] + block.bbox[3]) / 2.0
-    paste_x = int(
-        round(block_center_x_orig_coords - (final_surface_to_paste.width / 2.0))
-    )
-    paste_y = int(
-        round(block_center_y_orig_coords - (final_surface_to_paste.height / 2.0))
+    final_surface_to_paste, paste_x, paste_y = _place_block_layer(
+        rendered_block_content_pil, block.angle, block.bbox
     )
     if draw_target_image.mode != "RGBA":
         print(
             f"Warning (_draw_single_block_pil): draw_target_image is not RGBA (mode: {draw_target_image.mode}). Alpha compositing might not work as expected."
         )
     try:
-        if final_surface_to_paste.mode == "RGBA":
-            draw_target_image.alpha_composite(
-                final_surface_to_paste, (paste_x, paste_y)
-            )
-        else:
-            draw_target_image.paste(final_surface_to_paste, (paste_x, paste_y))
+        _composite_block_surface(
+            draw_target_image, final_surface_to_paste, (paste_x, paste_y)
+        )
     except Exception as e:
         print(
             f"Error compositing/pasting block '{block.translated_text[:20]}...' onto target image: {e}"
@@ -777,14 +931,66 @@ def _draw_single_block_pil(
             print(f"Fallback paste also failed for block: {e_paste}")
 
 
+_RENDER_CONFIG_SPEC = (
+    ("UI", "font_name", "msyh.ttc", "str"),
+    ("UI", "text_padding", 3, "int"),
+    ("UI", "text_main_color", "255,255,255,255", "str"),
+    ("UI", "text_outline_color", "0,0,0,255", "str"),
+    ("UI", "text_outline_thickness", 2, "int"),
+    ("UI", "text_background_color", "0,0,0,128", "str"),
+    ("UI", "h_text_char_spacing_px", 0, "int"),
+    ("UI", "h_text_line_spacing_px", 0, "int"),
+    ("UI", "v_text_char_spacing_px", 0, "int"),
+    ("UI", "v_text_column_spacing_px", 0, "int"),
+    ("UI", "h_manual_break_extra_spacing_px", 0, "int"),
+    ("UI", "v_manual_break_extra_spacing_px", 0, "int"),
+)
+_render_params_cache: dict[tuple, tuple] = {}
+_MAX_RENDER_WORKERS = 8
+
+
+@lru_cache(maxsize=64)
+def parse_rgba(color_string, default_rgba):
+    try:
+        parts = [int(part) for part in color_string.split(",")]
+    except (AttributeError, ValueError):
+        return default_rgba
+    if len(parts) == 4:
+        return (parts[0], parts[1], parts[2], parts[3])
+    if len(parts) == 3:
+        return (parts[0], parts[1], parts[2], 255)
+    return default_rgba
+
+
+def _build_render_params(render_config: dict) -> tuple:
+    return (
+        render_config[("UI", "font_name")],
+        render_config[("UI", "text_padding")],
+        parse_rgba(render_config[("UI", "text_main_color")], (255, 255, 255, 255)),
+        parse_rgba(render_config[("UI", "text_outline_color")], (0, 0, 0, 255)),
+        render_config[("UI", "text_outline_thickness")],
+        parse_rgba(render_config[("UI", "text_background_color")], (0, 0, 0, 128)),
+        render_config[("UI", "h_text_char_spacing_px")],
+        render_config[("UI", "h_text_line_spacing_px")],
+        render_config[("UI", "v_text_char_spacing_px")],
+        render_config[("UI", "v_text_column_spacing_px")],
+        render_config[("UI", "h_manual_break_extra_spacing_px")],
+        render_config[("UI", "v_manual_break_extra_spacing_px")],
+    )
+
+
 def draw_processed_blocks_pil(
     pil_image_original: Image.Image,
     processed_blocks: list,
     config_manager: ConfigManager,
+    in_place: bool = False,
 ) -> Image.Image | None:
     """
     Draws processed text blocks onto a copy of the original PIL image,
+    or onto the original itself when in_place=True and it is already RGBA,
     respecting per-block style overrides.
+    Returns None on failure when in_place=True, since the original may be
+    partially drawn.
     """
     if not PILLOW_AVAILABLE or not pil_image_original:
         print(
@@ -792,157 +998,129 @@ def draw_processed_blocks_pil(
         )
         return pil_image_original
     if not processed_blocks:
-        return pil_image_original.copy() if pil_image_original else None
+        return pil_image_original if in_place else pil_image_original.copy()
     try:
         if pil_image_original.mode != "RGBA":
             base_image = pil_image_original.convert("RGBA")
+        elif in_place:
+            base_image = pil_image_original
         else:
             base_image = pil_image_original.copy()
-        font_name_conf = config_manager.get("UI", "font_name", "msyh.ttc")
-        text_pad_conf = config_manager.getint("UI", "text_padding", 3)
-        main_color_str = config_manager.get("UI", "text_main_color", "255,255,255,255")
-        outline_color_str = config_manager.get("UI", "text_outline_color", "0,0,0,255")
-        outline_thick_conf_default = config_manager.getint(
-            "UI", "text_outline_thickness", 2
-        )
-        bg_color_str = config_manager.get("UI", "text_background_color", "0,0,0,128")
-        h_char_spacing_conf = config_manager.getint("UI", "h_text_char_spacing_px", 0)
-        h_line_spacing_conf = config_manager.getint("UI", "h_text_line_spacing_px", 0)
-        v_char_spacing_conf = config_manager.getint("UI", "v_text_char_spacing_px", 0)
-        v_col_spacing_conf = config_manager.getint("UI", "v_text_column_spacing_px", 0)
-        h_manual_break_extra_conf = config_manager.getint(
-            "UI", "h_manual_break_extra_spacing_px", 0
-        )
-        v_manual_break_extra_conf = config_manager.getint(
-            "UI", "v_manual_break_extra_spacing_px", 0
-        )
-
-        def _parse_color(color_string, default_rgba):
-            try:
-                parts = list(map(int, color_string.split(",")))
-                if len(parts) == 3:
-                    return tuple(parts) + (255,)
-                if len(parts) == 4:
-                    return tuple(parts)
-            except:
-                pass
-            return default_rgba
-
-        default_main_color_pil = _parse_color(main_color_str, (255, 255, 255, 255))
-        default_outline_color_pil = _parse_color(outline_color_str, (0, 0, 0, 255))
-        default_bg_color_pil = _parse_color(bg_color_str, (0, 0, 0, 128))
+        render_config = config_manager.get_many(_RENDER_CONFIG_SPEC)
+        render_signature = tuple(render_config.values())
+        render_params = _render_params_cache.get(render_signature)
+        if render_params is None:
+            if len(_render_params_cache) >= 16:
+                _render_params_cache.clear()
+            render_params = _build_render_params(render_config)
+            _render_params_cache[render_signature] = render_params
+        (
+            font_name_conf,
+            text_pad_conf,
+            default_main_color_pil,
+            default_outline_color_pil,
+            outline_thick_conf_default,
+            default_bg_color_pil,
+            h_char_spacing_conf,
+            h_line_spacing_conf,
+            v_char_spacing_conf,
+            v_col_spacing_conf,
+            h_manual_break_extra_conf,
+            v_manual_break_extra_conf,
+        ) = render_params
+        render_jobs = []
         for idx, block_item in enumerate(processed_blocks):
-            if (
-                not hasattr(block_item, "translated_text")
-                or not block_item.translated_text
-                or not block_item.translated_text.strip()
-            ):
+            if not block_item.translated_text or not block_item.translated_text.strip():
                 continue
-            if (
-                not hasattr(block_item, "bbox")
-                or not block_item.bbox
-                or len(block_item.bbox) != 4
-            ):
+            if not block_item.bbox or len(block_item.bbox) != 4:
                 print(
                     f"Skipping block {idx} ('{block_item.translated_text[:10]}...'): Invalid or missing bbox."
                 )
                 continue
-            if (
-                not hasattr(block_item, "font_size_pixels")
-                or not block_item.font_size_pixels
-                or block_item.font_size_pixels <= 0
-            ):
+            if not block_item.font_size_pixels or block_item.font_size_pixels <= 0:
                 print(
                     f"Skipping block {idx} ('{block_item.translated_text[:10]}...'): Invalid or missing font_size_pixels."
                 )
                 continue
             main_color_to_use = default_main_color_pil
-            if hasattr(block_item, "main_color") and block_item.main_color is not None:
-                if (
-                    isinstance(block_item.main_color, tuple)
-                    and len(block_item.main_color) == 4
-                ):
-                    main_color_to_use = block_item.main_color
+            if (
+                isinstance(block_item.main_color, tuple)
+                and len(block_item.main_color) == 4
+            ):
+                main_color_to_use = block_item.main_color
             outline_color_to_use = default_outline_color_pil
             if (
-                hasattr(block_item, "outline_color")
-                and block_item.outline_color is not None
+                isinstance(block_item.outline_color, tuple)
+                and len(block_item.outline_color) == 4
             ):
-                if (
-                    isinstance(block_item.outline_color, tuple)
-                    and len(block_item.outline_color) == 4
-                ):
-                    outline_color_to_use = block_item.outline_color
+                outline_color_to_use = block_item.outline_color
             bg_color_to_use = default_bg_color_pil
             if (
-                hasattr(block_item, "background_color")
-                and block_item.background_color is not None
+                isinstance(block_item.background_color, tuple)
+                and len(block_item.background_color) == 4
             ):
-                if (
-                    isinstance(block_item.background_color, tuple)
-                    and len(block_item.background_color) == 4
-                ):
-                    bg_color_to_use = block_item.background_color
+                bg_color_to_use = block_item.background_color
             thickness_to_use = outline_thick_conf_default
             if (
-                hasattr(block_item, "outline_thickness")
-                and block_item.outline_thickness is not None
+                isinstance(block_item.outline_thickness, int)
+                and block_item.outline_thickness >= 0
             ):
-                if (
-                    isinstance(block_item.outline_thickness, int)
-                    and block_item.outline_thickness >= 0
-                ):
-                    thickness_to_use = block_item.outline_thickness
-            orientation = getattr(block_item, "orientation", "horizontal")
-            text_align = getattr(
-                block_item,
-                "text_align",
-                "left" if orientation == "horizontal" else "right",
-            )
-            angle = getattr(block_item, "angle", 0.0)
-            rendered_block_content_pil = _render_single_block_pil_for_preview(
-                block=block_item,
-                font_name_config=font_name_conf,
-                text_main_color_pil=main_color_to_use,
-                text_outline_color_pil=outline_color_to_use,
-                text_bg_color_pil=bg_color_to_use,
-                outline_thickness=thickness_to_use,
-                text_padding=text_pad_conf,
-                h_char_spacing_px=h_char_spacing_conf,
-                h_line_spacing_px=h_line_spacing_conf,
-                v_char_spacing_px=v_char_spacing_conf,
-                v_col_spacing_px=v_col_spacing_conf,
-                h_manual_break_extra_px=h_manual_break_extra_conf,
-                v_manual_break_extra_px=v_manual_break_extra_conf,
-            )
-            if rendered_block_content_pil:
-                final_surface_to_paste = rendered_block_content_pil
-                if angle != 0:
-                    try:
-                        final_surface_to_paste = rendered_block_content_pil.rotate(
-                            -angle,
-                            expand=True,
-                            resample=Image.Resampling.BICUBIC,
-                            fillcolor=(0, 0, 0, 0),
-                        )
-                    except Exception as e:
-                        print(f"Error rotating block {idx} content: {e}")
-                        final_surface_to_paste = rendered_block_content_pil
-                block_center_x_orig = (block_item.bbox[0] + block_item.bbox[2]) / 2.0
-                block_center_y_orig = (block_item.bbox[1] + block_item.bbox[3]) / 2.0
-                paste_x = int(
-                    round(block_center_x_orig - (final_surface_to_paste.width / 2.0))
-                )
-                paste_y = int(
-                    round(block_center_y_orig - (final_surface_to_paste.height / 2.0))
+                thickness_to_use = block_item.outline_thickness
+            orientation = block_item.orientation
+            text_align = block_item.text_align
+            angle = block_item.angle
+            render_jobs.append(
+                (
+                    idx,
+                    block_item,
+                    angle,
+                    (
+                        block_item.translated_text,
+                        (
+                            block_item.bbox[2] - block_item.bbox[0],
+                            block_item.bbox[3] - block_item.bbox[1],
+                        ),
+                        orientation,
+                        text_align,
+                        block_item.font_size_pixels,
+                        font_name_conf,
+                        main_color_to_use,
+                        outline_color_to_use,
+                        bg_color_to_use,
+                        thickness_to_use,
+                        text_pad_conf,
+                        h_char_spacing_conf,
+                        h_line_spacing_conf,
+                        v_char_spacing_conf,
+                        v_col_spacing_conf,
+                        h_manual_break_extra_conf,
+                        v_manual_break_extra_conf,
+                    ),
                 )
+            )
+
+        def render_job(job):
+            _, job_block, job_angle, render_args = job
+            surface = _render_block_surface_cached(*render_args)
+            if not surface:
+                return None
+            return _place_block_layer(surface, job_angle, job_block.bbox)
+
+        worker_count = min(_MAX_RENDER_WORKERS, len(render_jobs), os.cpu_count() or 1)
+        if worker_count > 1:
+            for font_size in {int(job[1].font_size_pixels) for job in render_jobs}:
+                get_pil_font(font_name_conf, font_size)
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                placed_surfaces = list(executor.map(render_job, render_jobs))
+        else:
+            placed_surfaces = [render_job(job) for job in render_jobs]
+        for (idx, block_item, _, _), placed in zip(render_jobs, placed_surfaces):
+            if placed:
+                final_surface_to_paste, paste_x, paste_y = placed
                 try:
-                    if final_surface_to_paste.mode == "RGBA":
-                        base_image.alpha_composite(
-                            final_surface_to_paste, (paste_x, paste_y)
-                        )
-                    else:
-                        base_image.paste(final_surface_to_paste, (paste_x, paste_y))
+                    _composite_block_surface(
+                        base_image, final_surface_to_paste, (paste_x, paste_y)
+                    )
                 except ValueError as ve:
                     print(
                         f"Error pasting block {idx} at ({paste_x}, {paste_y}): {ve}. Block bbox: {block_item.bbox}"
@@ -957,4 +1135,4 @@ def draw_processed_blocks_pil(
         import traceback
 
         traceback.print_exc()
-        return pil_image_original
+        return None if in_place else pil_image_original